@@ -16,6 +16,7 @@ class SearchConfig(BaseModel):
     queries: list[str] = Field(default_factory=list)
     target_companies: list[str] = Field(default_factory=list, description="Companies to specifically search for internships at via LLM search")
     max_results_per_query: int = Field(default=50, ge=1, le=100)
+    linkedin_keywords: list[str] = Field(default_factory=lambda: ["summer 2026 internship"], description="Keywords searched on LinkedIn (all in one worker request)")
     max_company_batches: int = Field(default=10, ge=1, le=50, description="Max batches of target companies to search per LLM provider")
     require_post_date: bool = Field(default=False, description="Require postings to have a date (LLM search results often lack dates)")
     require_underclass_terms: bool = Field(default=False, description="Require explicit underclass terms (freshman/sophomore). If false, includes any internship not explicitly for upperclassmen.")
@@ -1,6 +1,7 @@
 """URL canonicalization utilities."""
 
 import re
+from functools import lru_cache
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 
@@ -12,10 +13,24 @@ TRACKING_PARAMS = {
     '_ga', '_gl', '_hsenc', '_hsmi', 'trk', 'trkInfo'
 }
 
+# Company slug patterns, in priority order
+ATS_SLUG_PATTERNS = [
+    # Greenhouse: boards.greenhouse.io/company or boards-api.greenhouse.io/v1/boards/company
+    re.compile(r'greenhouse\.io/(?:v1/boards/)?([a-zA-Z0-9_-]+)', re.IGNORECASE),
+    # Lever: jobs.lever.co/company
+    re.compile(r'lever\.co/([a-zA-Z0-9_-]+)', re.IGNORECASE),
+    # Ashby: jobs.ashbyhq.com/company
+    re.compile(r'ashbyhq\.com/([a-zA-Z0-9_-]+)', re.IGNORECASE),
+]
 
+
+@lru_cache(maxsize=4096)
 def canonicalize_url(url: str) -> str:
     """Canonicalize a URL by removing tracking parameters.
 
+    Cached alongside parse_ats_url: the same URLs recur across pages,
+    queries, and the dedup passes that canonicalize them again.
+
     Args:
         url: URL to canonicalize.
 
@@ -87,23 +102,29 @@ def extract_company_from_ats_url(url: str) -> str | None:
     Returns:
         Company slug or None.
     """
-    patterns = [
-        # Greenhouse: boards.greenhouse.io/company or boards-api.greenhouse.io/v1/boards/company
-        r'greenhouse\.io/(?:v1/boards/)?([a-zA-Z0-9_-]+)',
-        # Lever: jobs.lever.co/company
-        r'lever\.co/([a-zA-Z0-9_-]+)',
-        # Ashby: jobs.ashbyhq.com/company
-        r'ashbyhq\.com/([a-zA-Z0-9_-]+)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url, re.IGNORECASE)
+    for pattern in ATS_SLUG_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
 
     return None
 
 
+@lru_cache(maxsize=4096)
+def parse_ats_url(url: str) -> tuple[str | None, str | None]:
+    """Detect ATS type and company slug from URL in one call.
+
+    Cached because search providers see the same URLs across queries.
+
+    Args:
+        url: URL to analyze.
+
+    Returns:
+        Tuple of (ATS type, company slug), either of which may be None.
+    """
+    return detect_ats_type(url), extract_company_from_ats_url(url)
+
+
 def build_greenhouse_api_url(company: str) -> str:
     """Build Greenhouse API URL for a company."""
     return f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs?content=true"
@@ -40,6 +40,14 @@ def parse_date(date_string: Optional[str]) -> Optional[datetime]:
         except (ValueError, OSError):
             pass
 
+    # Fast path for ISO 8601 (what ATS APIs return); dateparser is ~1000x slower.
+    # Like dateparser, keep the wall-clock time and drop any UTC offset.
+    if len(date_string) >= 10 and date_string[4] == '-' and date_string[7] == '-':
+        try:
+            return datetime.fromisoformat(date_string).replace(tzinfo=None)
+        except ValueError:
+            pass
+
     # Use dateparser for flexible parsing
     try:
         parsed = dateparser.parse(
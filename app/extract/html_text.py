@@ -0,0 +1,53 @@
+"""HTML to plain text conversion."""
+
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# Elements whose own text is not page content (bs4's get_text() skips these too)
+_SKIP_TEXT = {'script', 'style', etree.Comment, etree.ProcessingInstruction}
+
+# Elements whose whole subtree is skipped (bs4 treats template contents as TemplateString)
+_SKIP_SUBTREE = {'template'}
+
+# lxml refuses str input carrying an XML encoding declaration; reparse as UTF-8 bytes
+_UTF8_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+def html_to_text(html: str) -> str:
+    """Extract whitespace-normalized text from an HTML fragment or document.
+
+    Equivalent to BeautifulSoup(html, 'lxml').get_text(separator=' ', strip=True),
+    but walks lxml's C tree directly instead of building bs4's Python node objects.
+
+    Args:
+        html: HTML string.
+
+    Returns:
+        Text of each node, stripped and joined with single spaces.
+    """
+    if not html or html.isspace():
+        return ''
+
+    try:
+        try:
+            root = lxml_html.document_fromstring(html)
+        except ValueError:
+            root = lxml_html.document_fromstring(html.encode('utf-8'), parser=_UTF8_PARSER)
+    except (etree.ParserError, ValueError):
+        return ''
+
+    parts = []
+    _collect_text(root, parts)
+    return ' '.join(part for part in parts if part)
+
+
+def _collect_text(element, parts: list[str]) -> None:
+    """Append the stripped text of an element and its descendants in document order."""
+    if element.tag not in _SKIP_TEXT and element.text:
+        parts.append(element.text.strip())
+    for child in element:
+        if child.tag not in _SKIP_SUBTREE:
+            _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail.strip())
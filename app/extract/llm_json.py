@@ -0,0 +1,53 @@
+"""Decoding JSON embedded in LLM responses."""
+
+import json
+from typing import Any, Callable, Optional
+
+
+_decoder = json.JSONDecoder()
+
+
+def _decode_first(content: str, opener: str, accept: Callable[[Any], bool]) -> Any:
+    """Decode the first acceptable JSON value starting with opener.
+
+    raw_decode stops at the end of the value, so markdown fences and
+    trailing commentary are skipped without stripping or slicing.
+    """
+    start = content.find(opener)
+    while start >= 0:
+        try:
+            value, _ = _decoder.raw_decode(content, start)
+            if accept(value):
+                return value
+        except json.JSONDecodeError:
+            pass
+        # A bracket in prose (e.g. a citation like "[1]"); try the next one
+        start = content.find(opener, start + 1)
+    return None
+
+
+def decode_json_array(content: str) -> Optional[list]:
+    """Decode the first JSON array of objects embedded in text.
+
+    Args:
+        content: Raw response text.
+
+    Returns:
+        Decoded list, or None if no array is found.
+    """
+    return _decode_first(
+        content, '[',
+        lambda value: isinstance(value, list) and all(isinstance(r, dict) for r in value)
+    )
+
+
+def decode_json_object(content: str) -> Optional[dict]:
+    """Decode the first JSON object embedded in text.
+
+    Args:
+        content: Raw response text.
+
+    Returns:
+        Decoded dict, or None if no object is found.
+    """
+    return _decode_first(content, '{', lambda value: isinstance(value, dict))
@@ -67,6 +67,9 @@ class PostingFilter:
         years = '|'.join(str(y) for y in self.exclusions.graduation_years)
         self.year_pattern = re.compile(rf'\b({years})\b')
 
+        # Season words before a year (e.g. "Summer 2026") mark an internship season
+        self.season_pattern = re.compile(r'\b(?:summer|fall|spring|winter)\s+', re.IGNORECASE)
+
         # Upperclass exclusion patterns (word boundaries)
         upper_terms = '|'.join(
             re.escape(term) for term in self.exclusions.upperclass_terms
@@ -103,12 +106,11 @@ class PostingFilter:
 
         # Rule 1: Check for excluded graduation years
         # Skip matches preceded by season words (e.g., "Summer 2026" is an internship season, not a grad year)
-        season_pattern = re.compile(r'\b(?:summer|fall|spring|winter)\s+', re.IGNORECASE)
         for year_match in self.year_pattern.finditer(text):
             # Check if this year is preceded by a season word
             prefix_start = max(0, year_match.start() - 30)
             prefix = text[prefix_start:year_match.start()]
-            if season_pattern.search(prefix):
+            if self.season_pattern.search(prefix):
                 continue  # "Summer 2026" etc. — skip
             self.stats.excluded_year += 1
             return FilterResult(
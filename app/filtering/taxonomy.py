@@ -1,6 +1,7 @@
 """Job function taxonomy classification."""
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from app.config import FunctionsConfig
@@ -35,6 +36,71 @@ class TaxonomyClassifier:
                 except re.error:
                     pass
             self._compiled_patterns[family_key] = patterns
+        self._flat_patterns = [p for patterns in self._compiled_patterns.values() for p in patterns]
+        # Family of each flat pattern index, and a zeroed score table to copy per call
+        self._pattern_families = [
+            family_key for family_key, patterns in self._compiled_patterns.items() for _ in patterns
+        ]
+        self._zero_scores = dict.fromkeys(self.config.families, 0.0)
+        self._fused_pattern = self._compile_fused_pattern()
+        self._boost_keywords = {
+            family_key: tuple(keyword.lower() for keyword in family_config.boost_keywords)
+            for family_key, family_config in self.config.families.items()
+        }
+        self._target_families = frozenset(
+            family_key for family_key, family_config in self.config.families.items()
+            if family_config.target and family_key != OTHER_FUNCTION
+        )
+        self._display_names = {
+            family_key: family_config.display_name
+            for family_key, family_config in self.config.families.items()
+        }
+        self._display_names[OTHER_FUNCTION] = "Other"
+
+    def _compile_fused_pattern(self) -> Optional[re.Pattern]:
+        """Fuse every family pattern into one zero-width alternation.
+
+        A single finditer pass over the fused pattern visits every position
+        where some pattern can start, instead of one full scan per pattern.
+
+        Returns:
+            Fused pattern, or None if the patterns cannot be safely combined
+            (capturing groups would be renumbered, or inline flags misplaced).
+        """
+        patterns = self._flat_patterns
+        if not patterns or any(p.groups for p in patterns):
+            return None
+        branches = '|'.join(f'(?:{p.pattern})' for p in patterns)
+        try:
+            return re.compile(f'(?=(?:{branches}))', re.IGNORECASE)
+        except re.error:
+            return None
+
+    def _matched_patterns(self, text: str) -> set[int]:
+        """Find which patterns occur in text, by flat index across families.
+
+        Args:
+            text: Text to scan.
+
+        Returns:
+            Indices of matching patterns.
+        """
+        patterns = self._flat_patterns
+        if self._fused_pattern is None:
+            return {i for i, p in enumerate(patterns) if p.search(text)}
+
+        matched: set[int] = set()
+        remaining = list(range(len(patterns)))
+        for match in self._fused_pattern.finditer(text):
+            # Some pattern starts here; find out which of the unmatched ones
+            pos = match.start()
+            hits = [i for i in remaining if patterns[i].match(text, pos)]
+            if hits:
+                matched.update(hits)
+                remaining = [i for i in remaining if i not in matched]
+                if not remaining:
+                    break
+        return matched
 
     def classify(self, title: str, description: str = "") -> tuple[str, float]:
         """Classify a job posting into a function family.
@@ -46,21 +112,78 @@ class TaxonomyClassifier:
         Returns:
             Tuple of (function family key, confidence score 0-1).
         """
-        combined_text = f"{title} {description}".lower()
-        scores: dict[str, float] = {key: 0.0 for key in self.config.families}
+        return self._score(
+            title,
+            description,
+            self._matched_patterns(title),
+            self._matched_patterns(description)
+        )
 
-        # Score based on patterns
-        for family_key, patterns in self._compiled_patterns.items():
-            for pattern in patterns:
-                if pattern.search(title):
-                    scores[family_key] += 3.0  # Title match is strong signal
-                if pattern.search(description):
-                    scores[family_key] += 0.5  # Description match is weaker
+    def classify_batch(self, items: list[tuple[str, str]]) -> list[tuple[str, float]]:
+        """Classify many postings at once.
 
-        # Boost based on keywords
-        for family_key, family_config in self.config.families.items():
-            for keyword in family_config.boost_keywords:
-                if keyword.lower() in combined_text:
+        A board lists the same title (and often the same description) once per
+        location, so patterns are scanned once per distinct title and
+        description rather than once per posting.
+
+        Args:
+            items: (title, description) pairs.
+
+        Returns:
+            (function family key, confidence) for each pair, in order.
+        """
+        title_matches: dict[str, set[int]] = {}
+        description_matches: dict[str, set[int]] = {}
+        results: dict[tuple[str, str], tuple[str, float]] = {}
+
+        classified = []
+        for title, description in items:
+            key = (title, description)
+            if key not in results:
+                if title not in title_matches:
+                    title_matches[title] = self._matched_patterns(title)
+                if description not in description_matches:
+                    description_matches[description] = self._matched_patterns(description)
+                results[key] = self._score(
+                    title,
+                    description,
+                    title_matches[title],
+                    description_matches[description]
+                )
+            classified.append(results[key])
+        return classified
+
+    def _score(
+        self,
+        title: str,
+        description: str,
+        title_matches: set[int],
+        description_matches: set[int]
+    ) -> tuple[str, float]:
+        """Score families from pattern matches and boost keywords.
+
+        Args:
+            title: Job title.
+            description: Job description text.
+            title_matches: Pattern indices matched in the title.
+            description_matches: Pattern indices matched in the description.
+
+        Returns:
+            Tuple of (function family key, confidence score 0-1).
+        """
+        combined_text = f"{title} {description}".lower()
+        scores = self._zero_scores.copy()
+
+        # Score based on patterns (sums of 3.0 and 0.5 are exact, so order is irrelevant)
+        for index in title_matches:
+            scores[self._pattern_families[index]] += 3.0  # Title match is strong signal
+        for index in description_matches:
+            scores[self._pattern_families[index]] += 0.5  # Description match is weaker
+
+        # Boost based on keywords (substring checks run in C; a fused regex is slower)
+        for family_key, keywords in self._boost_keywords.items():
+            for keyword in keywords:
+                if keyword in combined_text:
                     scores[family_key] += 0.3
 
         # Find best match
@@ -88,12 +211,7 @@ class TaxonomyClassifier:
         Returns:
             True if this family is marked as a target.
         """
-        if family == OTHER_FUNCTION:
-            return False
-        family_config = self.config.families.get(family)
-        if family_config is None:
-            return False
-        return family_config.target
+        return family in self._target_families
 
     def get_display_name(self, family: str) -> str:
         """Get human-readable name for function family.
@@ -104,12 +222,7 @@ class TaxonomyClassifier:
         Returns:
             Display name string.
         """
-        if family == OTHER_FUNCTION:
-            return "Other"
-        family_config = self.config.families.get(family)
-        if family_config is None:
-            return family
-        return family_config.display_name
+        return self._display_names.get(family, family)
 
     def get_target_families(self) -> list[str]:
         """Get list of target function family keys.
@@ -147,9 +260,33 @@ def classify_function(title: str, description: str = "") -> tuple[str, float]:
     Returns:
         Tuple of (function family key, confidence score 0-1).
     """
+    return _classify_cached(title, description)
+
+
+# Keyed on the full strings: truncating the description would change results.
+# Bounded so cached descriptions cost at most a few MB.
+@lru_cache(maxsize=1024)
+def _classify_cached(title: str, description: str) -> tuple[str, float]:
+    """Classify with the default classifier, memoizing repeated postings."""
     return get_default_classifier().classify(title, description)
 
 
+def classify_function_batch(items: list[tuple[str, str]]) -> list[tuple[str, float]]:
+    """Classify many job postings into function families.
+
+    Uses default configuration. For custom config, use TaxonomyClassifier directly.
+    ATS sources call this once per board, before their per-job parse guards,
+    so they pass '' for null titles or descriptions.
+
+    Args:
+        items: (title, description) pairs.
+
+    Returns:
+        Tuple of (function family key, confidence score 0-1) for each pair.
+    """
+    return get_default_classifier().classify_batch(items)
+
+
 def is_target_function(family: str) -> bool:
     """Check if function family is a target type.
 
@@ -30,7 +30,7 @@ from app.sources.search_provider import (
 )
 from app.sources.grok_search import GrokSearchProvider
 from app.sources.accelerators import AcceleratorScraper
-from app.sources.linkedin_search import search_linkedin, extract_companies
+from app.sources.linkedin_search import search_linkedin_many, extract_companies
 from app.storage.state import StateStore
 import requests
 import time
@@ -151,12 +151,7 @@ def fetch_from_ats(
     if lever_boards:
         logger.info(f"Fetching from {len(lever_boards)} Lever boards")
         lever_adapter = LeverAdapter()
-        for company in lever_boards:
-            try:
-                jobs = lever_adapter.fetch_jobs(company)
-                postings.extend(jobs)
-            except Exception as e:
-                logger.warning(f"Lever '{company}' failed: {e}")
+        postings.extend(lever_adapter.fetch_many(lever_boards))
 
     if ashby_boards:
         logger.info(f"Fetching from {len(ashby_boards)} Ashby boards")
@@ -322,20 +317,17 @@ def fetch_from_llm_search(
             added = _add_postings(grok_results)
             logger.info(f"Grok broad search: {len(grok_results)} postings ({added} new)")
 
-            # Targeted company batch searches
+            # Targeted company batch searches, several batches per request
+            grok_batches = grok_search.search_multi(
+                target_functions=target_functions,
+                underclass_terms=underclass_terms,
+                company_groups={f"batch-{i+1}": batch for i, batch in enumerate(company_batches)},
+                recency_days=config.search.recency_days
+            )
             for i, batch in enumerate(company_batches):
-                try:
-                    batch_results = grok_search.search(
-                        target_functions=target_functions,
-                        underclass_terms=underclass_terms,
-                        companies=batch,
-                        recency_days=config.search.recency_days
-                    )
-                    added = _add_postings(batch_results)
-                    if added > 0:
-                        logger.info(f"Grok batch {i+1}/{len(company_batches)}: {added} new from {', '.join(batch[:3])}...")
-                except Exception as e:
-                    logger.warning(f"Grok batch {i+1} failed: {e}")
+                added = _add_postings(grok_batches[f"batch-{i+1}"])
+                if added > 0:
+                    logger.info(f"Grok batch {i+1}/{len(company_batches)}: {added} new from {', '.join(batch[:3])}...")
         except Exception as e:
             logger.warning(f"Grok search failed: {e}")
 
@@ -747,9 +739,18 @@ def run_pipeline(
     # Fetch from LinkedIn search
     try:
         logger.info("Searching LinkedIn...")
-        linkedin_postings = search_linkedin("summer 2026 internship")
+        linkedin_postings = [
+            posting
+            for postings in search_linkedin_many(config.search.linkedin_keywords)
+            for posting in postings
+        ]
         existing_urls = {p.url for p in all_postings}
-        linkedin_new = [p for p in linkedin_postings if p.url not in existing_urls]
+        linkedin_new = []
+        for posting in linkedin_postings:
+            # Keywords overlap, so the same job can come back more than once
+            if posting.url not in existing_urls:
+                existing_urls.add(posting.url)
+                linkedin_new.append(posting)
         all_postings.extend(linkedin_new)
         logger.info(f"LinkedIn: {len(linkedin_postings)} found, {len(linkedin_new)} new")
 
@@ -1,14 +1,14 @@
 """Claude-powered job search using web search and intelligent parsing."""
 
-import json
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Hashable, Optional
 
-from anthropic import Anthropic
+from anthropic import Anthropic, Timeout
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.extract.canonical import canonicalize_url, detect_ats_type
 from app.extract.dates import parse_date
+from app.extract.llm_json import decode_json_array, decode_json_object
 from app.extract.normalize import OTHER_FUNCTION, Posting, ATSSource
 from app.logging_config import get_logger
 
@@ -70,6 +70,124 @@ Only include postings that:
 Return ONLY valid JSON array. If no valid postings found, return []."""
 
 
+# ATS platforms whose postings keep their own source; anything else is SEARCH
+_ATS_TO_SOURCE = {
+    'greenhouse': ATSSource.GREENHOUSE,
+    'lever': ATSSource.LEVER,
+    'ashby': ATSSource.ASHBY,
+}
+
+
+def _result_url_key(item_text: str) -> Optional[str]:
+    """Canonical URL of a streamed result object, as _parse_results dedups it."""
+    item = decode_json_object(item_text)
+    if item is None:
+        return None
+    url = item.get('url', '')
+    return canonicalize_url(url) if isinstance(url, str) else None
+
+
+class _JsonArrayScanner:
+    """Find a JSON array of objects in text that arrives in chunks.
+
+    Tracks bracket depth outside of string literals so a complete array is
+    recognised as soon as its closing bracket streams in, without re-scanning
+    the whole buffer on every chunk.
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        item_key: Optional[Callable[[str], Optional[Hashable]]] = None
+    ):
+        """Initialize scanner.
+
+        Args:
+            max_items: Stop once this many distinct top-level objects have closed.
+            item_key: Maps an object's text to a key; objects repeating an
+                earlier key don't count toward max_items. None keys always count.
+        """
+        self.max_items = max_items
+        self.item_key = item_key
+        self.text = ""
+        self._pos = 0
+        self._reset(-1)
+
+    def _reset(self, start: int) -> None:
+        self._start = start
+        self._depth = 0
+        self._items = 0
+        self._item_start = -1
+        self._keys: set = set()
+        self._in_string = False
+        self._escape = False
+
+    def _count_item(self, item_text: str) -> None:
+        key = self.item_key(item_text) if self.item_key else None
+        if key is None or key not in self._keys:
+            self._keys.add(key)
+            self._items += 1
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Append a chunk of text.
+
+        Args:
+            chunk: Next piece of streamed text.
+
+        Returns:
+            Text of a decodable array (truncated to max_items objects), or
+            None if no array has completed yet.
+        """
+        self.text += chunk
+        text = self.text
+
+        while self._pos < len(text):
+            char = text[self._pos]
+            pos = self._pos
+            self._pos += 1
+
+            if self._start < 0:
+                if char == '[':
+                    self._reset(pos)
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in '[{':
+                if char == '{' and self._depth == 1:
+                    self._item_start = pos
+                self._depth += 1
+            elif char in ']}':
+                self._depth -= 1
+                if char == '}' and self._depth == 1:
+                    self._count_item(text[self._item_start:pos + 1])
+
+                if self._depth == 0:
+                    candidate = text[self._start:pos + 1]
+                elif self._depth == 1 and self.max_items and self._items >= self.max_items:
+                    candidate = text[self._start:pos + 1] + ']'
+                else:
+                    continue
+
+                if decode_json_array(candidate) is not None:
+                    return candidate
+                # A bracket in prose (e.g. a citation like "[1]"); rescan after it
+                self._pos = self._start + 1
+                self._reset(-1)
+
+        return None
+
+
 class ClaudeSearchProvider:
     """Search provider that uses Claude with web search for intelligent job discovery."""
 
@@ -77,7 +195,8 @@ class ClaudeSearchProvider:
         self,
         api_key: str,
         model: str = "claude-sonnet-4-20250514",
-        max_results: int = 20
+        max_results: int = 20,
+        timeout: float = 60.0
     ):
         """Initialize Claude search provider.
 
@@ -85,8 +204,10 @@ class ClaudeSearchProvider:
             api_key: Anthropic API key.
             model: Model to use (must support web search).
             max_results: Maximum results to return.
+            timeout: Read/write timeout in seconds for API calls (the SDK
+                default is 10 minutes). Timed-out calls are retried by the SDK.
         """
-        self.client = Anthropic(api_key=api_key)
+        self.client = Anthropic(api_key=api_key, timeout=Timeout(timeout, connect=10.0))
         self.model = model
         self.max_results = max_results
         self.total_tokens_used = 0
@@ -137,7 +258,7 @@ Search for internship programs at these specific companies. Do multiple searches
         try:
             # Use Claude with web search tool - more searches for larger company lists
             max_searches = min(5 + (len(companies) // 20 if companies else 0), 10)
-            response = self.client.messages.create(
+            with self.client.messages.stream(
                 model=self.model,
                 max_tokens=8192,
                 system=SEARCH_SYSTEM_PROMPT,
@@ -158,19 +279,26 @@ After searching, provide the results as a JSON array of postings with: company,
 
 Return ONLY the JSON array."""
                 }]
-            )
+            ) as stream:
+                # Stop reading as soon as a complete array (or max_results
+                # distinct postings) has streamed in; closing the stream cancels
+                # the rest. Repeated URLs are dropped by _parse_results, so they
+                # must not use up result slots here
+                scanner = _JsonArrayScanner(max_items=self.max_results, item_key=_result_url_key)
+                array_text = None
+                for text in stream.text_stream:
+                    array_text = scanner.feed(text)
+                    if array_text is not None:
+                        break
+
+                # Output tokens are only final if the stream ran to completion
+                usage = stream.current_message_snapshot.usage
 
             # Track usage
-            self.total_tokens_used += response.usage.input_tokens + response.usage.output_tokens
-
-            # Extract text content
-            text_content = ""
-            for block in response.content:
-                if hasattr(block, 'text'):
-                    text_content += block.text
+            self.total_tokens_used += usage.input_tokens + usage.output_tokens
 
             # Parse results
-            return self._parse_results(text_content)
+            return self._parse_results(array_text if array_text is not None else scanner.text)
 
         except Exception as e:
             logger.error(f"Claude search failed: {e}")
@@ -187,51 +315,38 @@ Return ONLY the JSON array."""
         """
         postings = []
 
-        # Try to extract JSON from response
-        try:
-            # Clean up potential markdown
-            content = content.strip()
-            if content.startswith('```'):
-                lines = content.split('\n')
-                content = '\n'.join(lines[1:-1] if lines[-1].startswith('```') else lines[1:])
-
-            # Find JSON array
-            start = content.find('[')
-            end = content.rfind(']') + 1
-            if start >= 0 and end > start:
-                json_str = content[start:end]
-                results = json.loads(json_str)
-            else:
-                logger.warning("No JSON array found in Claude response")
-                return []
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse Claude response as JSON: {e}")
+        # Decode the first JSON array in the response
+        results = decode_json_array(content)
+        if results is None:
+            logger.warning("No JSON array found in Claude response")
             return []
 
-        # Convert to Posting objects
-        for item in results[:self.max_results]:
+        # Convert to Posting objects, skipping URLs Claude repeated (common when
+        # it merges several web searches) before paying for validation
+        seen_urls = set()
+        for item in results:
+            if len(postings) >= self.max_results:
+                break
+
             try:
+                url = item.get('url', '')
+                canonical_url = canonicalize_url(url)
+                if canonical_url in seen_urls:
+                    continue
+                seen_urls.add(canonical_url)
+
                 posted_at = None
                 if item.get('posted_at'):
                     posted_at = parse_date(item['posted_at'])
 
-                url = item.get('url', '')
-                ats_type = detect_ats_type(url)
-                source = ATSSource.SEARCH
-                if ats_type == 'greenhouse':
-                    source = ATSSource.GREENHOUSE
-                elif ats_type == 'lever':
-                    source = ATSSource.LEVER
-                elif ats_type == 'ashby':
-                    source = ATSSource.ASHBY
+                source = _ATS_TO_SOURCE.get(detect_ats_type(url), ATSSource.SEARCH)
 
                 posting = Posting(
                     company=item.get('company', 'Unknown'),
                     title=item.get('title', 'Unknown'),
                     function_family=item.get('function_family', OTHER_FUNCTION),
                     location=item.get('location', 'Not specified'),
-                    url=canonicalize_url(url),
+                    url=canonical_url,
                     source=source,
                     posted_at=posted_at,
                     text=item.get('description', ''),
@@ -248,15 +363,15 @@ Return ONLY the JSON array."""
         logger.info(f"Claude search found {len(postings)} postings")
         return postings
 
-    def search_company(self, company: str, ats_type: str) -> list[Posting]:
-        """Search for internships at a specific company.
+    def _company_search_params(self, company: str, ats_type: str) -> dict:
+        """Build Messages API parameters for a single-company search.
 
         Args:
             company: Company name or slug.
             ats_type: ATS type (greenhouse, lever, ashby).
 
         Returns:
-            List of Posting objects.
+            Keyword arguments for messages.create.
         """
         site_map = {
             'greenhouse': 'boards.greenhouse.io',
@@ -267,27 +382,47 @@ Return ONLY the JSON array."""
 
         query = f"underclass freshman sophomore internship site:{site}/{company}"
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                system=SEARCH_SYSTEM_PROMPT,
-                tools=[{
-                    "type": "web_search_20250305",
-                    "name": "web_search",
-                    "max_uses": 2
-                }],
-                messages=[{
-                    "role": "user",
-                    "content": f"""Search for underclass internship programs at {company}.
+        return {
+            "model": self.model,
+            "max_tokens": 2048,
+            "system": SEARCH_SYSTEM_PROMPT,
+            "tools": [{
+                "type": "web_search_20250305",
+                "name": "web_search",
+                "max_uses": 2
+            }],
+            "messages": [{
+                "role": "user",
+                "content": f"""Search for underclass internship programs at {company}.
 
 Search: {query}
 
 Return results as JSON array with: company, title, url, location, posted_at, underclass_evidence, function_family, description.
 
 Return ONLY valid JSON array."""
-                }]
-            )
+            }]
+        }
+
+    def search_company(
+        self,
+        company: str,
+        ats_type: str,
+        timeout: Optional[float] = None
+    ) -> list[Posting]:
+        """Search for internships at a specific company.
+
+        Args:
+            company: Company name or slug.
+            ats_type: ATS type (greenhouse, lever, ashby).
+            timeout: Per-call timeout override in seconds, for interactive callers.
+
+        Returns:
+            List of Posting objects.
+        """
+        client = self.client.with_options(timeout=timeout) if timeout else self.client
+
+        try:
+            response = client.messages.create(**self._company_search_params(company, ats_type))
 
             self.total_tokens_used += response.usage.input_tokens + response.usage.output_tokens
 
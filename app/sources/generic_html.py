@@ -1,5 +1,6 @@
 """Generic HTML job page parser."""
 
+import json
 import re
 from datetime import datetime
 from typing import Optional
@@ -108,7 +109,6 @@ class GenericHTMLParser:
         # Try schema.org
         for script in soup.find_all('script', type='application/ld+json'):
             try:
-                import json
                 data = json.loads(script.string)
                 if isinstance(data, dict):
                     hiring_org = data.get('hiringOrganization', {})
@@ -189,9 +189,9 @@ class GenericHTMLParser:
         # Last resort: body text
         body = soup.find('body')
         if body:
-            # Remove script/style
+            # Remove script/style (extract() just detaches; decompose() tears down every child node)
             for tag in body.find_all(['script', 'style', 'nav', 'footer', 'header']):
-                tag.decompose()
+                tag.extract()
             return body.get_text(separator=' ', strip=True)[:5000]
 
         return ""
@@ -208,7 +208,6 @@ class GenericHTMLParser:
         # Try schema.org
         for script in soup.find_all('script', type='application/ld+json'):
             try:
-                import json
                 data = json.loads(script.string)
                 if isinstance(data, dict):
                     location = data.get('jobLocation', {})
@@ -253,7 +252,6 @@ class GenericHTMLParser:
         # Try schema.org datePosted
         for script in soup.find_all('script', type='application/ld+json'):
             try:
-                import json
                 data = json.loads(script.string)
                 if isinstance(data, dict):
                     date_posted = data.get('datePosted')
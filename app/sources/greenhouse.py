@@ -1,16 +1,18 @@
 """Greenhouse ATS adapter."""
 
+import json
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.extract.canonical import canonicalize_url
 from app.extract.dates import parse_date
+from app.extract.html_text import html_to_text
 from app.extract.normalize import ATSSource, Posting
-from app.filtering.taxonomy import classify_function
+from app.filtering.taxonomy import classify_function, classify_function_batch
 from app.logging_config import get_logger
 
 
@@ -22,14 +24,53 @@ class GreenhouseAdapter:
 
     API_BASE = "https://boards-api.greenhouse.io/v1/boards"
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, cache_dir: Optional[str] = "cache"):
+        """Initialize adapter.
+
+        Args:
+            timeout: Request timeout in seconds.
+            cache_dir: Directory for cached board responses (None disables caching).
+        """
         self.timeout = timeout
+        self.cache_dir = Path(cache_dir) / "greenhouse" if cache_dir else None
         self.session = requests.Session()
         self.session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'InternshipScanner/1.0'
         })
 
+    def _get_cache_path(self, company: str) -> Path:
+        """Get cache file path for a board."""
+        return self.cache_dir / f"{company}.json"
+
+    def _load_cache(self, company: str) -> Optional[dict]:
+        """Load a cached board response with its validators."""
+        if self.cache_dir is None:
+            return None
+        cache_path = self._get_cache_path(company)
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load Greenhouse cache for '{company}': {e}")
+        return None
+
+    def _save_cache(self, company: str, response: requests.Response, data: dict) -> None:
+        """Save a board response if the server sent ETag/Last-Modified validators."""
+        if self.cache_dir is None:
+            return
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._get_cache_path(company), 'w') as f:
+                json.dump({'etag': etag, 'last_modified': last_modified, 'data': data}, f)
+        except Exception as e:
+            logger.warning(f"Failed to save Greenhouse cache for '{company}': {e}")
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -46,10 +87,24 @@ class GreenhouseAdapter:
         url = f"{self.API_BASE}/{company}/jobs?content=true"
         logger.debug(f"Fetching Greenhouse jobs: {url}")
 
+        # Conditional GET: an unchanged board answers 304 with no body
+        cached = self._load_cache(company)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and cached:
+                logger.debug(f"Greenhouse '{company}': not modified, using cache")
+                data = cached['data']
+            else:
+                response.raise_for_status()
+                data = response.json()
+                self._save_cache(company, response, data)
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch Greenhouse board '{company}': {e}")
             return []
@@ -57,20 +112,33 @@ class GreenhouseAdapter:
         jobs = data.get('jobs', [])
         postings = []
 
-        for job in jobs:
-            posting = self._parse_job(job, company)
+        texts = [html_to_text(job.get('content', '')) for job in jobs]
+        classifications = classify_function_batch(
+            [(job.get('title') or '', text) for job, text in zip(jobs, texts)]
+        )
+
+        for job, text, classification in zip(jobs, texts, classifications):
+            posting = self._parse_job(job, company, text, classification)
             if posting:
                 postings.append(posting)
 
         logger.info(f"Greenhouse '{company}': {len(postings)} jobs fetched")
         return postings
 
-    def _parse_job(self, job: dict, company: str) -> Optional[Posting]:
+    def _parse_job(
+        self,
+        job: dict,
+        company: str,
+        text: Optional[str] = None,
+        classification: Optional[tuple[str, float]] = None
+    ) -> Optional[Posting]:
         """Parse a single job from Greenhouse API response.
 
         Args:
             job: Job dict from API.
             company: Company slug.
+            text: Plain text of the job content, if already extracted.
+            classification: (function family, confidence), if already classified.
 
         Returns:
             Posting or None if parsing fails.
@@ -78,14 +146,10 @@ class GreenhouseAdapter:
         try:
             job_id = job.get('id')
             title = job.get('title', '')
-            content = job.get('content', '')
 
             # Extract plain text from HTML content
-            if content:
-                soup = BeautifulSoup(content, 'lxml')
-                text = soup.get_text(separator=' ', strip=True)
-            else:
-                text = ''
+            if text is None:
+                text = html_to_text(job.get('content', ''))
 
             # Get location
             location_data = job.get('location', {})
@@ -102,7 +166,9 @@ class GreenhouseAdapter:
             url = canonicalize_url(absolute_url)
 
             # Classify function
-            family, confidence = classify_function(title, text)
+            if classification is None:
+                classification = classify_function(title, text)
+            family, confidence = classification
 
             return Posting(
                 company=company.replace('-', ' ').title(),
@@ -1,23 +1,32 @@
 """Grok-powered job search using X.AI's API with web search capabilities."""
 
+import hashlib
 import json
+import time
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.extract.canonical import canonicalize_url, detect_ats_type
 from app.extract.dates import parse_date
+from app.extract.llm_json import decode_json_array, decode_json_object
 from app.extract.normalize import OTHER_FUNCTION, Posting, ATSSource
 from app.logging_config import get_logger
+from app.sources.rate_limit import RateLimiter
 
 
 logger = get_logger()
 
 
-SEARCH_PROMPT = """Search for underclass (freshman/sophomore) internship programs.
+SYSTEM_PROMPT = "You are a job search assistant with real-time web access. Search the web for current job postings and return structured JSON results."
 
-Requirements:
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+_SEARCH_REQUIREMENTS = """Requirements:
 - Must be explicitly for freshmen, sophomores, first-year, or second-year students
 - Programs labeled: "Discovery", "Explore", "Early Insight", "Pre-internship"
 - Roles in: {functions}
@@ -27,32 +36,64 @@ Requirements:
 EXCLUDE any postings mentioning:
 - "2027" or "2028" graduation years
 - "junior", "senior", "penultimate", "rising senior"
-- PhD, masters, graduate students
+- PhD, masters, graduate students"""
 
-Search query: {query}
 
-Return a JSON array of findings with:
-- company: Company name
+_FINDING_FIELDS = """- company: Company name
 - title: Job title
 - url: Direct link to posting
 - location: City/State or Remote
 - posted_at: Date if known (YYYY-MM-DD) or null
 - underclass_evidence: Exact phrase showing underclass targeting
 - function_family: SWE, PM, Consulting, IB, or Other
-- description: Brief 1-2 sentence description
+- description: Brief 1-2 sentence description"""
+
+
+SEARCH_PROMPT = f"""Search for underclass (freshman/sophomore) internship programs.
+
+{_SEARCH_REQUIREMENTS}
+
+Search query: {{query}}
+
+Return a JSON array of findings with:
+{_FINDING_FIELDS}
 
 Return ONLY valid JSON array. Empty array [] if none found."""
 
 
+MULTI_SEARCH_PROMPT = f"""Search for underclass (freshman/sophomore) internship programs at each group of companies below.
+
+{_SEARCH_REQUIREMENTS}
+
+{{groups}}
+
+Return a JSON object mapping each group label to a JSON array of that group's findings, each with:
+{_FINDING_FIELDS}
+
+Return ONLY a valid JSON object containing every group label. Use [] for groups with no findings."""
+
+
+@lru_cache(maxsize=64)
+def _query_fragments(target_functions: tuple[str, ...], underclass_terms: tuple[str, ...]) -> tuple[str, str]:
+    """Join functions and terms for prompts; the same lists recur across company batches."""
+    return ", ".join(target_functions), " OR ".join(underclass_terms[:5])
+
+
 class GrokSearchProvider:
     """Search provider using Grok (X.AI) with web search capabilities."""
 
-    def __init__(self, api_key: str, max_results: int = 20):
+    MODEL = "grok-3"
+    REQUESTS_PER_MINUTE = 60
+    # Shorter than the daily scan interval, so only same-day reruns hit the cache
+    CACHE_TTL_SECONDS = 20 * 3600
+
+    def __init__(self, api_key: str, max_results: int = 20, cache_dir: Optional[str] = "cache"):
         """Initialize Grok search provider.
 
         Args:
             api_key: X.AI API key.
             max_results: Maximum results to return.
+            cache_dir: Directory for cached responses (None disables caching).
         """
         try:
             from openai import OpenAI
@@ -65,8 +106,43 @@ class GrokSearchProvider:
             raise ImportError("openai package required: pip install openai")
 
         self.max_results = max_results
+        self.cache_dir = Path(cache_dir) / "grok" if cache_dir else None
+        self.rate_limiter = RateLimiter(self.REQUESTS_PER_MINUTE)
         self.tokens_used = 0
 
+    def _get_cache_path(self, prompt: str) -> Path:
+        """Get cache file path for a prompt, keyed by a hash of the request."""
+        key = hashlib.sha256(
+            json.dumps({"model": self.MODEL, "prompt": prompt}, sort_keys=True).encode()
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load_cache(self, prompt: str) -> Optional[str]:
+        """Load a cached response for a prompt if it is younger than CACHE_TTL_SECONDS."""
+        if self.cache_dir is None:
+            return None
+        cache_path = self._get_cache_path(prompt)
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'r') as f:
+                    cached = json.load(f)
+                if time.time() - cached['created_at'] < self.CACHE_TTL_SECONDS:
+                    return cached['content']
+            except Exception as e:
+                logger.warning(f"Failed to load Grok cache: {e}")
+        return None
+
+    def _save_cache(self, prompt: str, content: str) -> None:
+        """Save a response for a prompt."""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._get_cache_path(prompt), 'w') as f:
+                json.dump({'created_at': time.time(), 'content': content}, f)
+        except Exception as e:
+            logger.warning(f"Failed to save Grok cache: {e}")
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -89,8 +165,7 @@ class GrokSearchProvider:
         Returns:
             List of Posting objects.
         """
-        functions_str = ", ".join(target_functions)
-        terms_str = " OR ".join(underclass_terms[:5])
+        functions_str, terms_str = _query_fragments(tuple(target_functions), tuple(underclass_terms))
 
         if companies:
             query_companies = ", ".join(companies[:10])
@@ -109,15 +184,94 @@ class GrokSearchProvider:
             query=query
         ) + companies_addendum
 
+        content = self._complete(prompt)
+        return self._parse_results(content) if content is not None else []
+
+    def search_multi(
+        self,
+        target_functions: list[str],
+        underclass_terms: list[str],
+        company_groups: dict[str, list[str]],
+        recency_days: int = 7,
+        groups_per_request: int = 3
+    ) -> dict[str, list[Posting]]:
+        """Search several groups of companies with one Grok request per few groups.
+
+        Each request carries the shared instructions once and asks for a JSON
+        object keyed by group label, saving a round-trip and a copy of the
+        prompt per group compared with calling search() for each.
+
+        Args:
+            target_functions: Function families to search for.
+            underclass_terms: Terms indicating underclass targeting.
+            company_groups: Group label to the companies in that group.
+            recency_days: Only include recent postings.
+            groups_per_request: Maximum groups folded into one request.
+
+        Returns:
+            Dict mapping each group label to its postings (empty on failure).
+        """
+        functions_str, terms_str = _query_fragments(tuple(target_functions), tuple(underclass_terms))
+        results: dict[str, list[Posting]] = {label: [] for label in company_groups}
+
+        labels = list(company_groups)
+        for i in range(0, len(labels), groups_per_request):
+            request_labels = labels[i:i + groups_per_request]
+
+            sections = []
+            for label in request_labels:
+                companies = company_groups[label]
+                query = f"({terms_str}) internship ({functions_str}) at {', '.join(companies[:10])}"
+                companies_list = "\n".join(f"- {c}" for c in companies)
+                sections.append(f"GROUP \"{label}\"\nSearch query: {query}\nCompanies:\n{companies_list}")
+
+            logger.info(f"Grok searching {len(request_labels)} company groups in one request")
+
+            prompt = MULTI_SEARCH_PROMPT.format(
+                functions=functions_str,
+                days=recency_days,
+                groups="\n\n".join(sections)
+            )
+
+            content = self._complete(prompt, max_tokens=4096 * len(request_labels))
+            if content is None:
+                continue
+
+            by_label = decode_json_object(content)
+            if by_label is None:
+                logger.warning("No JSON object found in Grok response")
+                continue
+
+            for label in request_labels:
+                items = by_label.get(label)
+                if isinstance(items, list):
+                    results[label] = self._to_postings([item for item in items if isinstance(item, dict)])
+
+        return results
+
+    def _complete(self, prompt: str, max_tokens: int = 4096) -> Optional[str]:
+        """Get Grok's response to a prompt, from cache when possible.
+
+        Args:
+            prompt: User prompt.
+            max_tokens: Output token limit.
+
+        Returns:
+            Response text, or None if the request failed.
+        """
+        # A rerun of the same search on the same day returns the same postings
+        cached = self._load_cache(prompt)
+        if cached is not None:
+            logger.info("Grok search: using cached response")
+            return cached
+
+        self.rate_limiter.acquire()
         try:
             response = self.client.chat.completions.create(
-                model="grok-3",
-                max_tokens=4096,
+                model=self.MODEL,
+                max_tokens=max_tokens,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a job search assistant with real-time web access. Search the web for current job postings and return structured JSON results."
-                    },
+                    SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ]
             )
@@ -126,35 +280,28 @@ class GrokSearchProvider:
             if response.usage:
                 self.tokens_used += response.usage.total_tokens
 
-            return self._parse_results(content)
+            if content:
+                self._save_cache(prompt, content)
+
+            return content
 
         except Exception as e:
             logger.error(f"Grok search failed: {e}")
-            return []
+            return None
 
     def _parse_results(self, content: str) -> list[Posting]:
         """Parse Grok response into Posting objects."""
-        postings = []
-
-        try:
-            # Clean markdown
-            content = content.strip()
-            if content.startswith('```'):
-                lines = content.split('\n')
-                content = '\n'.join(lines[1:-1] if lines[-1].startswith('```') else lines[1:])
-
-            # Find JSON array
-            start = content.find('[')
-            end = content.rfind(']') + 1
-            if start >= 0 and end > start:
-                results = json.loads(content[start:end])
-            else:
-                return []
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse Grok response: {e}")
+        results = decode_json_array(content or '')
+        if results is None:
+            logger.warning("No JSON array found in Grok response")
             return []
 
+        return self._to_postings(results)
+
+    def _to_postings(self, results: list[dict]) -> list[Posting]:
+        """Convert decoded Grok findings into Posting objects."""
+        postings = []
+
         for item in results[:self.max_results]:
             try:
                 posted_at = parse_date(item.get('posted_at')) if item.get('posted_at') else None
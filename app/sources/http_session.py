@@ -0,0 +1,24 @@
+"""Shared HTTP session setup."""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 64) -> requests.Session:
+    """Create a requests session with a large per-host connection pool.
+
+    requests' default adapter keeps only 10 connections per host, so
+    concurrent fetches beyond that open (and then discard) new sockets,
+    each paying a fresh TCP+TLS handshake.
+
+    Args:
+        pool_size: Connections kept alive per host, and hosts kept pooled.
+
+    Returns:
+        Configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
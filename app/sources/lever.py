@@ -1,17 +1,20 @@
 """Lever ATS adapter."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.extract.canonical import canonicalize_url
 from app.extract.dates import parse_date
+from app.extract.html_text import html_to_text
 from app.extract.normalize import ATSSource, Posting
-from app.filtering.taxonomy import classify_function
+from app.filtering.taxonomy import classify_function, classify_function_batch
 from app.logging_config import get_logger
+from app.sources.http_session import create_session
 
 
 logger = get_logger()
@@ -22,14 +25,38 @@ class LeverAdapter:
 
     API_BASE = "https://api.lever.co/v0/postings"
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_workers: int = 16):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        self.session = create_session()
         self.session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'InternshipScanner/1.0'
         })
 
+    def fetch_many(self, companies: list[str]) -> list[Posting]:
+        """Fetch jobs from several Lever boards concurrently.
+
+        Args:
+            companies: Company board slugs.
+
+        Returns:
+            Postings from every board that fetched successfully, in board order.
+        """
+        if not companies:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(companies))) as executor:
+            futures = [(company, executor.submit(self.fetch_jobs, company)) for company in companies]
+
+        postings = []
+        for company, future in futures:
+            try:
+                postings.extend(future.result())
+            except Exception as e:
+                logger.warning(f"Lever '{company}' failed: {e}")
+        return postings
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -49,8 +76,9 @@ class LeverAdapter:
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            jobs = response.json()
-        except requests.RequestException as e:
+            # Parse the body bytes directly; response.json() first decodes a full str copy
+            jobs = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.warning(f"Failed to fetch Lever board '{company}': {e}")
             return []
 
@@ -59,20 +87,66 @@ class LeverAdapter:
             return []
 
         postings = []
-        for job in jobs:
-            posting = self._parse_job(job, company)
+
+        descriptions = [self._extract_description(job) for job in jobs]
+        classifications = classify_function_batch(
+            [(job.get('text') or '', description) for job, description in zip(jobs, descriptions)]
+        )
+
+        for job, description, classification in zip(jobs, descriptions, classifications):
+            posting = self._parse_job(job, company, description, classification)
             if posting:
                 postings.append(posting)
 
         logger.info(f"Lever '{company}': {len(postings)} jobs fetched")
         return postings
 
-    def _parse_job(self, job: dict, company: str) -> Optional[Posting]:
+    def _extract_description(self, job: dict) -> str:
+        """Extract plain-text description from a Lever job.
+
+        Args:
+            job: Job dict from API.
+
+        Returns:
+            Description text.
+        """
+        # Lever uses 'descriptionPlain' or nested lists
+        description = job.get('descriptionPlain') or ''
+        if not description:
+            # Try to extract from lists
+            description = ' '.join(
+                value
+                for lst in job.get('lists') or []
+                if isinstance(lst, dict)
+                for value in (lst.get('text'), lst.get('content'))
+                if value and isinstance(value, str)
+            )
+
+        # Additional opening text
+        additional = job.get('additional', '')
+        if additional:
+            description = f"{description} {additional}"
+
+        # Clean HTML (or bare entities) if present
+        if '<' in description or '&' in description:
+            description = html_to_text(description)
+
+        return description
+
+    def _parse_job(
+        self,
+        job: dict,
+        company: str,
+        description: Optional[str] = None,
+        classification: Optional[tuple[str, float]] = None
+    ) -> Optional[Posting]:
         """Parse a single job from Lever API response.
 
         Args:
             job: Job dict from API.
             company: Company slug.
+            description: Plain-text description, if already extracted.
+            classification: (function family, confidence), if already classified.
 
         Returns:
             Posting or None if parsing fails.
@@ -80,26 +154,8 @@ class LeverAdapter:
         try:
             title = job.get('text', '')
 
-            # Get description - Lever uses 'descriptionPlain' or nested lists
-            description = job.get('descriptionPlain', '')
-            if not description:
-                # Try to extract from lists
-                lists_data = job.get('lists', [])
-                parts = []
-                for lst in lists_data:
-                    parts.append(lst.get('text', ''))
-                    parts.append(lst.get('content', ''))
-                description = ' '.join(filter(None, parts))
-
-            # Additional opening text
-            additional = job.get('additional', '')
-            if additional:
-                description = f"{description} {additional}"
-
-            # Clean HTML if present
-            if '<' in description:
-                soup = BeautifulSoup(description, 'lxml')
-                description = soup.get_text(separator=' ', strip=True)
+            if description is None:
+                description = self._extract_description(job)
 
             # Get location
             categories = job.get('categories', {})
@@ -109,7 +165,11 @@ class LeverAdapter:
 
             # Parse date (Lever uses millisecond timestamps)
             created_at = job.get('createdAt')
-            posted_at = parse_date(str(created_at)) if created_at else None
+            if isinstance(created_at, int):
+                # Same conversion parse_date does, minus the str round-trip
+                posted_at = datetime.fromtimestamp(created_at / 1000)
+            else:
+                posted_at = parse_date(str(created_at)) if created_at else None
 
             # Build URL
             hosting_url = job.get('hostedUrl', '')
@@ -117,7 +177,9 @@ class LeverAdapter:
             url = canonicalize_url(hosting_url or apply_url)
 
             # Classify function
-            family, confidence = classify_function(title, description)
+            if classification is None:
+                classification = classify_function(title, description)
+            family, confidence = classification
 
             return Posting(
                 company=company.replace('-', ' ').title(),
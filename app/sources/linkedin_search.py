@@ -1,50 +1,135 @@
 """LinkedIn job search via linkedin-jobs-api (Node.js)."""
 
+import atexit
 import json
+import queue
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from app.extract.normalize import ATSSource, Posting
-from app.filtering.taxonomy import classify_function
+from app.filtering.taxonomy import classify_function_batch
 from app.logging_config import get_logger
 
 
 logger = get_logger()
 
-LINKEDIN_SEARCH_SCRIPT = """
-const linkedIn = require('linkedin-jobs-api');
+LINKEDIN_WORKER_SCRIPT = """
+// linkedin-jobs-api logs progress with console.log; keep stdout for responses
+const respond = response => process.stdout.write(JSON.stringify(response) + '\\n');
+console.log = console.error;
 
-const queryOptions = {
-  keyword: KEYWORD_PLACEHOLDER,
-  location: 'United States',
-  dateSincePosted: 'past 24 hours',
-  jobType: '',
-  remoteFilter: '',
-  salary: '',
-  experienceLevel: 'internship',
-  limit: '50',
-  page: '0',
-};
-
-linkedIn.query(queryOptions).then(response => {
-  const results = response.map(job => ({
-    title: job.position || '',
-    company: job.company || '',
-    location: job.location || '',
-    url: job.jobUrl || '',
-    date: job.date || '',
-    agoTime: job.agoTime || '',
+const linkedIn = require('linkedin-jobs-api');
+const readline = require('readline');
+
+// One JSON request per stdin line: {keywords: [...], limit: '50'}
+readline.createInterface({input: process.stdin}).on('line', line => {
+  const {keywords, limit} = JSON.parse(line);
+
+  const queries = keywords.map(keyword => linkedIn.query({
+    keyword: keyword,
+    location: 'United States',
+    dateSincePosted: 'past 24 hours',
+    jobType: '',
+    remoteFilter: '',
+    salary: '',
+    experienceLevel: 'internship',
+    limit: limit,
+    page: '0',
   }));
-  console.log(JSON.stringify(results));
-}).catch(err => {
-  console.error(JSON.stringify({error: err.message}));
-  process.exit(1);
+
+  // One failed keyword shouldn't drop the others; it comes back as null
+  Promise.allSettled(queries).then(settled => {
+    const errors = [];
+    const results = settled.map((outcome, i) => {
+      if (outcome.status === 'rejected') {
+        errors.push(`${keywords[i]}: ${outcome.reason}`);
+        return null;
+      }
+      return outcome.value.map(job => ({
+        title: job.position || '',
+        company: job.company || '',
+        location: job.location || '',
+        url: job.jobUrl || '',
+        date: job.date || '',
+        agoTime: job.agoTime || '',
+      }));
+    });
+    respond({results, errors});
+  });
 });
 """
 
 
+class _LinkedInWorker:
+    """Long-lived Node.js process answering LinkedIn queries over JSON lines."""
+
+    def __init__(self):
+        # Run from project root where node_modules is installed
+        project_root = str(Path(__file__).resolve().parent.parent.parent)
+        self.process = subprocess.Popen(
+            ['node', '-e', LINKEDIN_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            cwd=project_root
+        )
+        # Read stdout on a thread so requests can time out
+        self._lines: queue.Queue[Optional[str]] = queue.Queue()
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+
+    def _read_stdout(self) -> None:
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)  # EOF: the process exited
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(self, payload: dict, timeout: float) -> dict:
+        """Send one request and wait for its response.
+
+        Raises:
+            queue.Empty: If no response arrives within timeout.
+            RuntimeError: If the worker exited.
+        """
+        self.process.stdin.write(json.dumps(payload) + '\n')
+        self.process.stdin.flush()
+        line = self._lines.get(timeout=timeout)
+        if line is None:
+            raise RuntimeError(
+                f"worker exited with code {self.process.wait()} (is linkedin-jobs-api installed?)"
+            )
+        return orjson.loads(line)
+
+    def close(self) -> None:
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+_worker: Optional[_LinkedInWorker] = None
+_worker_lock = threading.Lock()
+
+
+def _stop_worker() -> None:
+    """Terminate the Node.js worker, if running."""
+    global _worker
+    if _worker is not None:
+        _worker.close()
+        _worker = None
+
+
+atexit.register(_stop_worker)
+
+
 def search_linkedin(keyword: str = "summer 2026 internship", limit: int = 50) -> list[Posting]:
     """Search LinkedIn for internship postings using linkedin-jobs-api.
 
@@ -55,47 +140,59 @@ def search_linkedin(keyword: str = "summer 2026 internship", limit: int = 50) ->
     Returns:
         List of Posting objects.
     """
-    script = LINKEDIN_SEARCH_SCRIPT.replace(
-        'KEYWORD_PLACEHOLDER',
-        json.dumps(keyword)
-    ).replace("'50'", f"'{limit}'")
+    return search_linkedin_many([keyword], limit)[0]
 
-    try:
-        # Run from project root where node_modules is installed
-        project_root = str(Path(__file__).resolve().parent.parent.parent)
-        result = subprocess.run(
-            ['node', '-e', script],
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=project_root
-        )
 
-        if result.returncode != 0:
-            logger.warning(f"LinkedIn search failed: {result.stderr.strip()}")
-            return []
-
-        # The library prints debug lines to stdout before JSON; extract only the JSON line
-        stdout_lines = result.stdout.strip().split('\n')
-        json_line = None
-        for line in reversed(stdout_lines):
-            line = line.strip()
-            if line.startswith('['):
-                json_line = line
-                break
-        if not json_line:
-            logger.warning("LinkedIn search: no JSON output found")
-            return []
-
-        jobs = json.loads(json_line)
-    except subprocess.TimeoutExpired:
-        logger.warning("LinkedIn search timed out")
-        return []
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        logger.warning(f"LinkedIn search error: {e}")
+def search_linkedin_many(keywords: list[str], limit: int = 50) -> list[list[Posting]]:
+    """Search LinkedIn for several keywords concurrently.
+
+    Queries go to a persistent Node.js worker, so Node startup and loading
+    linkedin-jobs-api are paid once per process rather than once per search.
+
+    Args:
+        keywords: Search keywords.
+        limit: Max results per keyword.
+
+    Returns:
+        List of Posting lists, one per keyword (empty on failure).
+    """
+    global _worker
+    if not keywords:
         return []
 
-    postings = []
+    with _worker_lock:
+        try:
+            if _worker is None or not _worker.is_alive():
+                _worker = _LinkedInWorker()
+            response = _worker.request({'keywords': keywords, 'limit': str(limit)}, timeout=120)
+        except queue.Empty:
+            logger.warning("LinkedIn search timed out")
+            _stop_worker()
+            return [[] for _ in keywords]
+        except (RuntimeError, OSError, json.JSONDecodeError) as e:
+            logger.warning(f"LinkedIn search error: {e}")
+            _stop_worker()
+            return [[] for _ in keywords]
+
+    for error in response.get('errors', []):
+        logger.warning(f"LinkedIn search failed: {error}")
+
+    # Keep one list per keyword even if the worker's reply is short or malformed
+    results = response.get('results') or []
+    results = list(results[:len(keywords)]) + [[]] * (len(keywords) - len(results))
+    return [_to_postings(jobs or []) for jobs in results]
+
+
+def _to_postings(jobs: list[dict]) -> list[Posting]:
+    """Convert linkedin-jobs-api results to Posting objects.
+
+    Args:
+        jobs: Job dicts emitted by the Node script.
+
+    Returns:
+        List of Posting objects.
+    """
+    rows = []
     for job in jobs:
         title = job.get('title', '').strip()
         company = job.get('company', '').strip()
@@ -109,8 +206,13 @@ def search_linkedin(keyword: str = "summer 2026 internship", limit: int = 50) ->
         if '?' in url:
             url = url.split('?')[0]
 
-        family, confidence = classify_function(title, '')
+        rows.append((title, company, location, url))
+
+    # LinkedIn results repeat the same few titles; classify them in one batch
+    classifications = classify_function_batch([(title, '') for title, _, _, _ in rows])
 
+    postings = []
+    for (title, company, location, url), (family, confidence) in zip(rows, classifications):
         postings.append(Posting(
             company=company,
             title=title,
@@ -0,0 +1,40 @@
+"""Client-side rate limiting for API calls."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Shapes requests to a provider's published rate so bursts (e.g. parallel
+    page fetches) wait briefly client-side instead of collecting 429s and
+    sitting out tenacity's exponential backoff.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 10):
+        """Initialize limiter.
+
+        Args:
+            requests_per_minute: Sustained request rate.
+            burst: Requests allowed back-to-back before shaping starts.
+        """
+        self.interval = 60.0 / requests_per_minute
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            # Reserve a token now (possibly going negative) so concurrent
+            # callers queue up behind each other instead of racing
+            self._tokens -= 1
+            wait = -self._tokens * self.interval
+
+        if wait > 0:
+            time.sleep(wait)
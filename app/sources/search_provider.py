@@ -2,15 +2,20 @@
 
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional
 
+import orjson
 import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from app.extract.canonical import detect_ats_type, extract_company_from_ats_url
+from app.extract.canonical import canonicalize_url, parse_ats_url
 from app.logging_config import get_logger
+from app.sources.http_session import create_session
+from app.sources.rate_limit import RateLimiter
 
 
 logger = get_logger()
@@ -29,6 +34,10 @@ class SearchResult:
 class SearchProvider(ABC):
     """Abstract base class for search providers."""
 
+    API_URL = ""
+    NAME = ""
+    REQUESTS_PER_MINUTE = 60
+
     @abstractmethod
     def search(
         self,
@@ -48,11 +57,68 @@ class SearchProvider(ABC):
         """
         pass
 
+    def _get_page(self, params: dict) -> Optional[dict]:
+        """Fetch one page of results.
+
+        Args:
+            params: Query parameters.
+
+        Returns:
+            Decoded JSON body, or None if the request failed.
+        """
+        self.rate_limiter.acquire()
+        try:
+            response = self.session.get(
+                self.API_URL,
+                params=params,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.warning(f"{self.NAME} request failed: {e}")
+            return None
+
+    def _fetch_pages(
+        self,
+        page_params: list[dict],
+        has_more: Callable[[dict, dict], bool]
+    ) -> list[dict]:
+        """Fetch result pages, requesting all pages after the first in parallel.
+
+        Page parameters depend only on the offset, so once the first page
+        says more results exist the rest are fetched concurrently rather
+        than one round-trip at a time.
+
+        Args:
+            page_params: Query parameters for each page, in order.
+            has_more: Called with (params, body); True if later pages exist.
+
+        Returns:
+            Page bodies in order, stopping at the first failed page or the
+            first page that reports no more results.
+        """
+        bodies = [self._get_page(page_params[0])] if page_params else []
+        if len(page_params) > 1 and bodies[0] is not None and has_more(page_params[0], bodies[0]):
+            with ThreadPoolExecutor(max_workers=len(page_params) - 1) as executor:
+                bodies.extend(executor.map(self._get_page, page_params[1:]))
+
+        pages = []
+        for params, body in zip(page_params, bodies):
+            if body is None:
+                break
+            pages.append(body)
+            if not has_more(params, body):
+                break
+        return pages
+
 
 class GoogleCSEProvider(SearchProvider):
     """Google Custom Search Engine provider."""
 
     API_URL = "https://www.googleapis.com/customsearch/v1"
+    NAME = "Google CSE"
+    REQUESTS_PER_MINUTE = 100  # Default per-user quota
 
     def __init__(self, api_key: str, cx: str, timeout: int = 30):
         """Initialize Google CSE provider.
@@ -65,7 +131,8 @@ class GoogleCSEProvider(SearchProvider):
         self.api_key = api_key
         self.cx = cx
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = RateLimiter(self.REQUESTS_PER_MINUTE)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -88,55 +155,54 @@ class GoogleCSEProvider(SearchProvider):
             List of SearchResult objects.
         """
         results = []
-        start_index = 1
+        seen_urls = set()  # Pages often overlap, especially with date restrictions
 
         # Calculate date range for recency filter
         date_restrict = f"d{recency_days}"
 
-        while len(results) < max_results:
-            params = {
+        page_params = [
+            {
                 'key': self.api_key,
                 'cx': self.cx,
                 'q': query,
                 'dateRestrict': date_restrict,
                 'start': start_index,
-                'num': min(10, max_results - len(results))  # Max 10 per request
+                'num': min(10, max_results - start_index + 1)  # Max 10 per request
             }
+            for start_index in range(1, max_results + 1, 10)
+        ]
 
-            try:
-                response = self.session.get(
-                    self.API_URL,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-            except requests.RequestException as e:
-                logger.warning(f"Google CSE request failed: {e}")
-                break
+        # More results exist if the response links a next page
+        pages = self._fetch_pages(
+            page_params,
+            lambda params, data: bool(data.get('queries', {}).get('nextPage'))
+        )
 
+        for data in pages:
             items = data.get('items', [])
             if not items:
                 break
 
             for item in items:
+                if len(results) >= max_results:
+                    break
+
                 url = item.get('link', '')
+                canonical_url = canonicalize_url(url)
+                if canonical_url in seen_urls:
+                    continue
+                seen_urls.add(canonical_url)
+
+                ats_type, company_slug = parse_ats_url(url)
                 result = SearchResult(
                     title=item.get('title', ''),
                     url=url,
                     snippet=item.get('snippet', ''),
-                    ats_type=detect_ats_type(url),
-                    company_slug=extract_company_from_ats_url(url)
+                    ats_type=ats_type,
+                    company_slug=company_slug
                 )
                 results.append(result)
 
-            # Check if there are more results
-            next_page = data.get('queries', {}).get('nextPage')
-            if not next_page:
-                break
-
-            start_index += 10
-
         logger.info(f"Google CSE returned {len(results)} results for query")
         return results[:max_results]
 
@@ -145,6 +211,8 @@ class BingSearchProvider(SearchProvider):
     """Bing Web Search API provider."""
 
     API_URL = "https://api.bing.microsoft.com/v7.0/search"
+    NAME = "Bing search"
+    REQUESTS_PER_MINUTE = 180  # 3 transactions per second on the free tier
 
     def __init__(self, api_key: str, timeout: int = 30):
         """Initialize Bing provider.
@@ -155,7 +223,8 @@ class BingSearchProvider(SearchProvider):
         """
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = RateLimiter(self.REQUESTS_PER_MINUTE)
         self.session.headers.update({
             'Ocp-Apim-Subscription-Key': api_key
         })
@@ -181,7 +250,7 @@ class BingSearchProvider(SearchProvider):
             List of SearchResult objects.
         """
         results = []
-        offset = 0
+        seen_urls = set()
 
         # Bing freshness parameter
         if recency_days <= 1:
@@ -191,49 +260,48 @@ class BingSearchProvider(SearchProvider):
         else:
             freshness = "Month"
 
-        while len(results) < max_results:
-            params = {
+        page_params = [
+            {
                 'q': query,
-                'count': min(50, max_results - len(results)),
+                'count': min(50, max_results - offset),
                 'offset': offset,
                 'freshness': freshness,
                 'responseFilter': 'Webpages'
             }
+            for offset in range(0, max_results, 50)
+        ]
 
-            try:
-                response = self.session.get(
-                    self.API_URL,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-            except requests.RequestException as e:
-                logger.warning(f"Bing search request failed: {e}")
-                break
+        # More results exist until the estimated total is reached
+        def has_more(params: dict, data: dict) -> bool:
+            web_pages = data.get('webPages', {})
+            total_estimated = web_pages.get('totalEstimatedMatches', 0)
+            return params['offset'] + len(web_pages.get('value', [])) < total_estimated
 
+        for data in self._fetch_pages(page_params, has_more):
             web_pages = data.get('webPages', {}).get('value', [])
             if not web_pages:
                 break
 
             for page in web_pages:
+                if len(results) >= max_results:
+                    break
+
                 url = page.get('url', '')
+                canonical_url = canonicalize_url(url)
+                if canonical_url in seen_urls:
+                    continue
+                seen_urls.add(canonical_url)
+
+                ats_type, company_slug = parse_ats_url(url)
                 result = SearchResult(
                     title=page.get('name', ''),
                     url=url,
                     snippet=page.get('snippet', ''),
-                    ats_type=detect_ats_type(url),
-                    company_slug=extract_company_from_ats_url(url)
+                    ats_type=ats_type,
+                    company_slug=company_slug
                 )
                 results.append(result)
 
-            # Check for more results
-            total_estimated = data.get('webPages', {}).get('totalEstimatedMatches', 0)
-            if offset + len(web_pages) >= total_estimated:
-                break
-
-            offset += len(web_pages)
-
         logger.info(f"Bing returned {len(results)} results for query")
         return results[:max_results]
 
@@ -242,6 +310,7 @@ class SerpAPIProvider(SearchProvider):
     """SerpAPI provider (supports multiple search engines)."""
 
     API_URL = "https://serpapi.com/search"
+    NAME = "SerpAPI"
 
     def __init__(self, api_key: str, timeout: int = 30):
         """Initialize SerpAPI provider.
@@ -252,7 +321,8 @@ class SerpAPIProvider(SearchProvider):
         """
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = create_session()
+        self.rate_limiter = RateLimiter(self.REQUESTS_PER_MINUTE)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -275,54 +345,54 @@ class SerpAPIProvider(SearchProvider):
             List of SearchResult objects.
         """
         results = []
-        start = 0
+        seen_urls = set()
 
         # SerpAPI time-based query modifier
         tbs = f"qdr:d{recency_days}" if recency_days <= 30 else "qdr:m"
 
-        while len(results) < max_results:
-            params = {
+        page_params = [
+            {
                 'api_key': self.api_key,
                 'engine': 'google',
                 'q': query,
                 'tbs': tbs,
                 'start': start,
-                'num': min(100, max_results - len(results))
+                'num': min(100, max_results - start)
             }
+            for start in range(0, max_results, 100)
+        ]
 
-            try:
-                response = self.session.get(
-                    self.API_URL,
-                    params=params,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-            except requests.RequestException as e:
-                logger.warning(f"SerpAPI request failed: {e}")
-                break
+        # More results exist if the response links a next page
+        pages = self._fetch_pages(
+            page_params,
+            lambda params, data: bool(data.get('serpapi_pagination', {}).get('next'))
+        )
 
+        for data in pages:
             organic = data.get('organic_results', [])
             if not organic:
                 break
 
             for item in organic:
+                if len(results) >= max_results:
+                    break
+
                 url = item.get('link', '')
+                canonical_url = canonicalize_url(url)
+                if canonical_url in seen_urls:
+                    continue
+                seen_urls.add(canonical_url)
+
+                ats_type, company_slug = parse_ats_url(url)
                 result = SearchResult(
                     title=item.get('title', ''),
                     url=url,
                     snippet=item.get('snippet', ''),
-                    ats_type=detect_ats_type(url),
-                    company_slug=extract_company_from_ats_url(url)
+                    ats_type=ats_type,
+                    company_slug=company_slug
                 )
                 results.append(result)
 
-            # Check pagination
-            if not data.get('serpapi_pagination', {}).get('next'):
-                break
-
-            start += len(organic)
-
         logger.info(f"SerpAPI returned {len(results)} results for query")
         return results[:max_results]
 
@@ -372,9 +442,20 @@ def build_internship_query(
     Returns:
         Search query string.
     """
+    # Callers build the same query for every batch, so key on hashable tuples
+    return _build_internship_query(tuple(underclass_terms[:5]), tuple(role_terms[:5]), site_filter)
+
+
+@lru_cache(maxsize=64)
+def _build_internship_query(
+    underclass_terms: tuple[str, ...],
+    role_terms: tuple[str, ...],
+    site_filter: bool
+) -> str:
+    """Build the search query from at most five terms of each kind."""
     # Core query parts
-    underclass = ' OR '.join(f'"{term}"' for term in underclass_terms[:5])
-    roles = ' OR '.join(f'"{term}"' for term in role_terms[:5])
+    underclass = ' OR '.join(f'"{term}"' for term in underclass_terms)
+    roles = ' OR '.join(f'"{term}"' for term in role_terms)
 
     query_parts = [
         f"({underclass})",
@@ -1,30 +1,39 @@
 """Workday ATS adapter."""
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.extract.canonical import canonicalize_url
 from app.extract.dates import parse_date
+from app.extract.html_text import html_to_text
 from app.extract.normalize import ATSSource, Posting
-from app.filtering.taxonomy import classify_function
+from app.filtering.taxonomy import classify_function, classify_function_batch
 from app.logging_config import get_logger
+from app.sources.http_session import create_session
 
 
 logger = get_logger()
 
 
+# Relative dates like "Posted 2 Days Ago" or "Posted 30+ Days Ago"
+_DAYS_AGO_PATTERN = re.compile(r'(\d+)\+?\s*days?\s*ago')
+
+
 class WorkdayAdapter:
     """Adapter for Workday CXS API."""
 
     PAGE_SIZE = 20
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, max_workers: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        self.session = create_session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json',
@@ -37,6 +46,10 @@ class WorkdayAdapter:
     def _cxs_url(self, tenant: str, instance: str, portal: str) -> str:
         return f"{self._base_url(tenant, instance)}/wday/cxs/{tenant}/{portal}"
 
+    def _company_name(self, tenant: str) -> str:
+        # Use tenant name as company, title-cased
+        return tenant.replace('-', ' ').replace('_', ' ').title()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
@@ -52,55 +65,107 @@ class WorkdayAdapter:
         Returns:
             List of normalized Posting objects.
         """
-        postings = []
-        offset = 0
-        total = None
-
-        while True:
-            url = f"{self._cxs_url(tenant, instance, portal)}/jobs"
-            payload = {
-                "limit": self.PAGE_SIZE,
-                "offset": offset,
-                "appliedFacets": {},
-                "searchText": ""
-            }
-
-            try:
-                response = self.session.post(url, json=payload, timeout=self.timeout)
-                response.raise_for_status()
-                data = response.json()
-            except requests.RequestException as e:
-                logger.warning(f"Failed to fetch Workday board '{tenant}': {e}")
-                break
-
-            if total is None:
-                total = data.get('total', 0)
-                logger.debug(f"Workday '{tenant}': {total} total jobs")
-
-            job_postings = data.get('jobPostings', [])
+        url = f"{self._cxs_url(tenant, instance, portal)}/jobs"
+
+        # The first page reports the total, after which every remaining page
+        # offset is known and can be requested concurrently
+        first = self._get_page(url, 0, tenant)
+        if first is None:
+            return []
+
+        total = first.get('total', 0)
+        logger.debug(f"Workday '{tenant}': {total} total jobs")
+
+        first_jobs = first.get('jobPostings', [])
+        if total == 0 or not first_jobs:
+            logger.info(f"Workday '{tenant}': 0 jobs fetched")
+            return []
+
+        pages = [first]
+        # A short first page is the whole board, whatever total claims
+        offsets = range(self.PAGE_SIZE, total, self.PAGE_SIZE) if len(first_jobs) >= self.PAGE_SIZE else []
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(offsets))) as executor:
+                pages.extend(executor.map(lambda offset: self._get_page(url, offset, tenant), offsets))
+
+        jobs = []
+        for data in pages:
+            # Stop where the serial walk would have: a failed or empty page
+            job_postings = data.get('jobPostings', []) if data else []
             if not job_postings:
                 break
+            jobs.extend(job_postings)
+            if len(job_postings) < self.PAGE_SIZE:
+                break
 
-            for job in job_postings:
-                posting = self._parse_job(job, tenant, instance, portal)
-                if posting:
-                    postings.append(posting)
+        classifications = classify_function_batch(
+            [(job.get('title') or '', self._bullet_text(job)) for job in jobs]
+        )
 
-            offset += len(job_postings)
-            if offset >= total:
-                break
+        # Same for every job on the board
+        base_url = self._base_url(tenant, instance)
+        company_name = self._company_name(tenant)
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        postings = []
+        for job, classification in zip(jobs, classifications):
+            posting = self._parse_job(job, base_url, portal, company_name, classification, today)
+            if posting:
+                postings.append(posting)
 
         logger.info(f"Workday '{tenant}': {len(postings)} jobs fetched")
         return postings
 
-    def _parse_job(self, job: dict, tenant: str, instance: str, portal: str) -> Optional[Posting]:
+    def _get_page(self, url: str, offset: int, tenant: str) -> Optional[dict]:
+        """Fetch one page of a Workday jobs list.
+
+        Args:
+            url: CXS jobs endpoint.
+            offset: Index of the first job on the page.
+            tenant: Company tenant, for logging.
+
+        Returns:
+            Decoded response body, or None if the request failed.
+        """
+        payload = {
+            "limit": self.PAGE_SIZE,
+            "offset": offset,
+            "appliedFacets": {},
+            "searchText": ""
+        }
+
+        try:
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.warning(f"Failed to fetch Workday board '{tenant}': {e}")
+            return None
+
+    @staticmethod
+    def _bullet_text(job: dict) -> str:
+        """Join a listed job's bullet fields (extra context such as job ID)."""
+        bullet_fields = job.get('bulletFields') or []
+        return ' | '.join(field for field in bullet_fields if isinstance(field, str))
+
+    def _parse_job(
+        self,
+        job: dict,
+        base_url: str,
+        portal: str,
+        company_name: str,
+        classification: Optional[tuple[str, float]] = None,
+        today: Optional[datetime] = None
+    ) -> Optional[Posting]:
         """Parse a single job from Workday jobs list response.
 
         Args:
             job: Job dict from API (jobPostings item).
-            tenant: Company tenant.
-            instance: Data center instance.
+            base_url: Career site base URL for the tenant and instance.
             portal: Career site portal name.
+            company_name: Display name for the tenant.
+            classification: (function family, confidence), if already classified.
+            today: UTC midnight that relative dates count back from.
 
         Returns:
             Posting or None if parsing fails.
@@ -112,22 +177,17 @@ class WorkdayAdapter:
             posted_on = job.get('postedOn', '')
 
             # Parse the posted date (e.g., "Posted Yesterday", "Posted 2 Days Ago", "Posted 30+ Days Ago")
-            posted_at = self._parse_workday_date(posted_on)
+            posted_at = self._parse_workday_date(posted_on, today)
 
             # Build canonical URL
-            base = self._base_url(tenant, instance)
-            raw_url = f"{base}/{portal}{external_path}"
-            url = canonicalize_url(raw_url)
+            url = canonicalize_url(f"{base_url}/{portal}{external_path}")
 
-            # Extract bullet fields for extra context
-            bullet_fields = job.get('bulletFields', [])
-            bullet_text = ' | '.join(bullet_fields) if bullet_fields else ''
+            bullet_text = self._bullet_text(job)
 
             # Classify function from title + bullets
-            family, confidence = classify_function(title, bullet_text)
-
-            # Use tenant name as company, title-cased
-            company_name = tenant.replace('-', ' ').replace('_', ' ').title()
+            if classification is None:
+                classification = classify_function(title, bullet_text)
+            family, confidence = classification
 
             return Posting(
                 company=company_name,
@@ -145,7 +205,7 @@ class WorkdayAdapter:
             logger.warning(f"Failed to parse Workday job: {e}")
             return None
 
-    def _parse_workday_date(self, posted_on: str) -> Optional[datetime]:
+    def _parse_workday_date(self, posted_on: str, today: Optional[datetime] = None) -> Optional[datetime]:
         """Parse Workday's relative date strings.
 
         Workday uses formats like:
@@ -156,6 +216,7 @@ class WorkdayAdapter:
 
         Args:
             posted_on: Workday date string.
+            today: UTC midnight to count back from (defaults to the current day).
 
         Returns:
             Parsed datetime or None.
@@ -164,18 +225,19 @@ class WorkdayAdapter:
             return None
 
         text = posted_on.strip().lower()
+        if today is None:
+            today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
         if 'today' in text:
-            return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            return today
         elif 'yesterday' in text:
-            return (datetime.utcnow() - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            return today - timedelta(days=1)
         else:
             # Try to extract "N Days Ago" or "30+ Days Ago"
-            import re
-            match = re.search(r'(\d+)\+?\s*days?\s*ago', text)
+            match = _DAYS_AGO_PATTERN.search(text)
             if match:
                 days = int(match.group(1))
-                return (datetime.utcnow() - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+                return today - timedelta(days=days)
 
         # Fallback to dateparser
         return parse_date(posted_on)
@@ -198,8 +260,8 @@ class WorkdayAdapter:
         try:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as e:
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.warning(f"Failed to fetch Workday job {external_path}: {e}")
             return None
 
@@ -211,10 +273,7 @@ class WorkdayAdapter:
             start_date = info.get('startDate', '')
 
             # Extract plain text from HTML description
-            text = ''
-            if description_html:
-                soup = BeautifulSoup(description_html, 'lxml')
-                text = soup.get_text(separator=' ', strip=True)
+            text = html_to_text(description_html)
 
             # Build canonical URL
             base = self._base_url(tenant, instance)
@@ -225,7 +284,7 @@ class WorkdayAdapter:
             posted_at = parse_date(start_date) if start_date else None
 
             family, confidence = classify_function(title, text)
-            company_name = tenant.replace('-', ' ').replace('_', ' ').title()
+            company_name = self._company_name(tenant)
 
             return Posting(
                 company=company_name,
@@ -1,8 +1,10 @@
 """SQLite storage for deduplication state."""
 
+import atexit
 import sqlite3
+import threading
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -31,6 +33,16 @@ class StateStore:
     CREATE INDEX IF NOT EXISTS idx_last_seen ON postings_seen(last_seen_at);
     """
 
+    # Hashes per IN (...) lookup, well under SQLite's bound-variable limit
+    QUERY_CHUNK_SIZE = 500
+
+    # Shared by single and batch paths so both hit the same cached statement
+    MARK_SEEN_SQL = """
+    INSERT INTO postings_seen (hash, first_seen_at, last_seen_at, url, company, title)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(hash) DO UPDATE SET last_seen_at = excluded.last_seen_at
+    """
+
     def __init__(self, db_path: str | Path = "internships.db"):
         """Initialize state store.
 
@@ -38,24 +50,46 @@ class StateStore:
             db_path: Path to SQLite database file.
         """
         self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        atexit.register(self.close)
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._get_connection() as conn:
+            # WAL with synchronous=NORMAL syncs at checkpoints rather than on every commit
+            conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+            """)
             conn.executescript(self.SCHEMA)
             conn.commit()
         logger.debug(f"Initialized database at {self.db_path}")
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Get the store's long-lived connection, serializing access across threads.
+
+        Rolls back on error so a failed write cannot be committed by the next call.
+        """
+        with self._lock:
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            # Refresh planner statistics for tables whose queries would benefit
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+            self._conn = None
 
     def is_seen(self, posting: Posting) -> bool:
         """Check if a posting has been seen before.
@@ -82,21 +116,14 @@ class StateStore:
         now = datetime.utcnow().isoformat()
 
         with self._get_connection() as conn:
-            conn.execute("""
-                INSERT INTO postings_seen (hash, first_seen_at, last_seen_at, url, company, title)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(hash) DO UPDATE SET last_seen_at = ?
-            """, (
-                posting.posting_hash,
-                now,
-                now,
-                posting.url,
-                posting.company,
-                posting.title,
-                now
-            ))
+            conn.execute(self.MARK_SEEN_SQL, self._seen_row(posting, now))
             conn.commit()
 
+    @staticmethod
+    def _seen_row(posting: Posting, now: str) -> tuple:
+        """Bind parameters for MARK_SEEN_SQL."""
+        return (posting.posting_hash, now, now, posting.url, posting.company, posting.title)
+
     def mark_emailed(self, posting: Posting) -> None:
         """Mark a posting as emailed.
 
@@ -122,15 +149,31 @@ class StateStore:
         """
         new_postings = []
         seen_count = 0
+        now = datetime.utcnow().isoformat()
+        hashes = list({posting.posting_hash for posting in postings})
 
-        for posting in postings:
-            if self.is_seen(posting):
-                seen_count += 1
-                # Update last_seen timestamp
-                self.mark_seen(posting)
-            else:
-                new_postings.append(posting)
-                self.mark_seen(posting)
+        with self._get_connection() as conn:
+            # One lookup per chunk rather than per posting, and one commit overall
+            seen_hashes = set()
+            for i in range(0, len(hashes), self.QUERY_CHUNK_SIZE):
+                chunk = hashes[i:i + self.QUERY_CHUNK_SIZE]
+                cursor = conn.execute(
+                    f"SELECT hash FROM postings_seen WHERE hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                seen_hashes.update(row[0] for row in cursor)
+
+            for posting in postings:
+                if posting.posting_hash in seen_hashes:
+                    seen_count += 1
+                else:
+                    new_postings.append(posting)
+                    # Repeats later in this batch count as seen, as before
+                    seen_hashes.add(posting.posting_hash)
+
+            # Insert new postings and update last_seen timestamp of seen ones
+            conn.executemany(self.MARK_SEEN_SQL, [self._seen_row(posting, now) for posting in postings])
+            conn.commit()
 
         logger.info(f"Dedupe: {len(new_postings)} new, {seen_count} previously seen")
         return new_postings
@@ -183,17 +226,14 @@ class StateStore:
         Returns:
             List of posting records.
         """
-        cutoff = datetime.utcnow().replace(
-            hour=0, minute=0, second=0
-        )
-        cutoff = cutoff.isoformat()
+        cutoff = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
 
         with self._get_connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM postings_seen
-                WHERE last_seen_at >= date(?, '-' || ? || ' days')
+                WHERE last_seen_at >= ?
                 ORDER BY last_seen_at DESC
-            """, (cutoff, days))
+            """, (cutoff,))
             return [dict(row) for row in cursor.fetchall()]
 
     def get_stats(self) -> dict:
@@ -230,12 +270,12 @@ class StateStore:
         Returns:
             Number of entries removed.
         """
-        cutoff = datetime.utcnow().isoformat()
+        cutoff = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
 
         with self._get_connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM postings_seen
-                WHERE last_seen_at < date(?, '-' || ? || ' days')
-            """, (cutoff, days))
+                WHERE last_seen_at < ?
+            """, (cutoff,))
             conn.commit()
             return cursor.rowcount
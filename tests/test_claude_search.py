@@ -0,0 +1,61 @@
+"""Tests for incremental JSON array scanning of streamed Claude output."""
+
+import json
+
+from app.extract.llm_json import decode_json_array
+from app.sources.claude_search import _JsonArrayScanner, _result_url_key
+
+
+def feed_all(scanner: _JsonArrayScanner, chunks: list[str]):
+    """Feed chunks until the scanner reports an array."""
+    for chunk in chunks:
+        result = scanner.feed(chunk)
+        if result is not None:
+            return result
+    return None
+
+
+class TestJsonArrayScanner:
+    """Tests for _JsonArrayScanner."""
+
+    def test_skips_prose_brackets(self):
+        """Citation-style brackets before the array should be skipped."""
+        text = 'As shown in [1] and [2, 3]: [{"url": "a"}] Done.'
+        assert feed_all(_JsonArrayScanner(), [text]) == '[{"url": "a"}]'
+
+    def test_brackets_and_escaped_quotes_in_strings(self):
+        """Brackets and escaped quotes inside strings should not affect depth."""
+        array = '[{"title": "Intern ] [ {", "note": "say \\"hi]\\" }"}]'
+        assert json.loads(array)
+        assert feed_all(_JsonArrayScanner(), [f"Results: {array}"]) == array
+
+    def test_chunk_boundaries(self):
+        """Splitting anywhere, even inside an escape, gives the same result."""
+        text = 'Here [1]: [{"title": "a \\"]\\" b", "url": "x"}, {"url": "y"}] end'
+        expected = feed_all(_JsonArrayScanner(), [text])
+        assert expected is not None
+        assert feed_all(_JsonArrayScanner(), list(text)) == expected
+        for split in range(1, len(text)):
+            assert feed_all(_JsonArrayScanner(), [text[:split], text[split:]]) == expected
+
+    def test_unclosed_prose_bracket_falls_back_to_full_text(self):
+        """An unclosed prose bracket hides the array; the full text still decodes."""
+        scanner = _JsonArrayScanner()
+        assert feed_all(scanner, ['Results [see below: ', '[{"url": "a"}]']) is None
+        assert decode_json_array(scanner.text) == [{"url": "a"}]
+
+    def test_max_items_truncates(self):
+        """The array should be cut off once max_items objects have closed."""
+        chunks = ['[{"url": "a"}, ', '{"url": "b"}, ', '{"url": "c"}]']
+        scanner = _JsonArrayScanner(max_items=2)
+        result = feed_all(scanner, chunks)
+        assert decode_json_array(result) == [{"url": "a"}, {"url": "b"}]
+        assert not scanner.text.endswith('"c"}]')
+
+    def test_max_items_ignores_repeated_keys(self):
+        """Repeated URLs should not use up result slots."""
+        chunks = ['[{"url": "https://x.com/a?utm_source=s"}, ', '{"url": "https://x.com/a"}, ', '{"url": "https://x.com/b"}]']
+        result = feed_all(_JsonArrayScanner(max_items=2, item_key=_result_url_key), chunks)
+        assert [item["url"] for item in decode_json_array(result)] == [
+            "https://x.com/a?utm_source=s", "https://x.com/a", "https://x.com/b"
+        ]
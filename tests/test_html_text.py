@@ -0,0 +1,37 @@
+"""Tests for HTML to plain text conversion."""
+
+import warnings
+
+import pytest
+from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+
+from app.extract.html_text import html_to_text
+
+
+CASES = [
+    '<p>Software <b>Engineering</b> Intern</p><p>Summer 2026</p>',
+    '<div>one<br>two</div>tail',
+    '<p>x<!-- hidden -->y</p><style>p { color: red; }</style>',
+    '<p>a</p><script>var b = 1;</script><p>c</p>',
+    '<p>a</p><template><p>hidden</p>more</template>tail<p>b</p>',
+    '<?xml version="1.0" encoding="utf-8"?><p>café</p>',
+    '<?xml version="1.0" encoding="iso-8859-1"?>\n<div><p>one</p>two</div>',
+    '&lt;p&gt;escaped&lt;/p&gt; &amp; more',
+]
+
+
+class TestHtmlToText:
+    """Tests for html_to_text."""
+
+    @pytest.mark.parametrize("html", CASES)
+    def test_matches_beautifulsoup(self, html):
+        """Output should match bs4's get_text(separator=' ', strip=True)."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", XMLParsedAsHTMLWarning)
+            expected = BeautifulSoup(html, 'lxml').get_text(separator=' ', strip=True)
+        assert html_to_text(html) == expected
+
+    @pytest.mark.parametrize("html", ['', '   \n'])
+    def test_blank_input(self, html):
+        """Blank input should give an empty string."""
+        assert html_to_text(html) == ''
@@ -0,0 +1,52 @@
+"""Tests for the Lever adapter."""
+
+from unittest import mock
+
+import orjson
+
+from app.sources.lever import LeverAdapter
+
+
+def _fetch(jobs: list) -> list:
+    """Run fetch_jobs against a mocked response body, without retries."""
+    adapter = LeverAdapter()
+    adapter.session = mock.Mock()
+    adapter.session.get.return_value = mock.Mock(content=orjson.dumps(jobs))
+    return adapter.fetch_jobs.__wrapped__(adapter, "acme")
+
+
+def _job(job_id: str, **fields) -> dict:
+    job = {
+        "text": "Software Engineering Intern",
+        "hostedUrl": f"https://jobs.lever.co/acme/{job_id}",
+        "categories": {"location": "New York"},
+        "descriptionPlain": "Build services in Python.",
+    }
+    job.update(fields)
+    return job
+
+
+class TestMalformedJobs:
+    """A malformed job should be dropped without losing the rest of the board."""
+
+    def test_null_lists(self):
+        """A null 'lists' field should not abort the board."""
+        postings = _fetch([_job("a"), _job("b", descriptionPlain="", lists=None), _job("c")])
+        assert len(postings) == 3
+
+    def test_non_dict_list_entries(self):
+        """List entries that are not dicts should be skipped."""
+        postings = _fetch([
+            _job("a"),
+            _job("b", descriptionPlain="", lists=["oops", {"text": "Duties", "content": "Write code"}, None]),
+        ])
+        assert len(postings) == 2
+        assert postings[1].text == "Duties Write code"
+
+    def test_null_title_drops_only_that_job(self):
+        """A job that fails to parse should be skipped, keeping valid ones."""
+        postings = _fetch([_job("a"), _job("b", text=None), _job("c")])
+        assert [p.url for p in postings] == [
+            "https://jobs.lever.co/acme/a",
+            "https://jobs.lever.co/acme/c",
+        ]
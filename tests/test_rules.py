@@ -11,30 +11,42 @@ from app.extract.normalize import OTHER_FUNCTION, Posting
 from app.filtering.rules import PostingFilter, quick_exclude_check
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def keywords_config():
     """Default keywords configuration."""
     return KeywordsConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def exclusions_config():
     """Default exclusions configuration."""
     return ExclusionsConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def posting_filter(keywords_config, exclusions_config):
-    """Configured posting filter."""
+    """Configured posting filter.
+
+    Shared across tests: filter_posting only updates its stats counters,
+    which no test asserts on.
+    """
     return PostingFilter(keywords_config, exclusions_config, recency_days=7)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_postings():
-    """Load sample postings from fixtures."""
+    """Load sample postings from fixtures, with posted_at parsed to naive UTC."""
     fixtures_path = Path(__file__).parent / "fixtures" / "postings.json"
     with open(fixtures_path) as f:
-        return json.load(f)
+        fixtures = json.load(f)
+
+    for fixture in fixtures:
+        posted_at = fixture.get("posted_at")
+        if posted_at:
+            if posted_at.endswith("Z"):
+                posted_at = posted_at[:-1]
+            fixture["posted_at"] = datetime.fromisoformat(posted_at).replace(tzinfo=None)
+    return fixtures
 
 
 def make_posting(
@@ -236,12 +248,6 @@ class TestFixturePostings:
     def test_all_fixtures(self, posting_filter, sample_postings):
         """Test all fixture postings match expected decisions."""
         for fixture in sample_postings:
-            posted_at = None
-            if fixture.get("posted_at"):
-                posted_at = datetime.fromisoformat(
-                    fixture["posted_at"].replace("Z", "+00:00")
-                ).replace(tzinfo=None)
-
             # Determine function family
             family = "SWE"
             if fixture.get("expected_family"):
@@ -259,7 +265,7 @@ class TestFixturePostings:
                 function_family=family,
                 location=fixture["location"],
                 url=fixture["url"],
-                posted_at=posted_at,
+                posted_at=fixture.get("posted_at"),
                 text=fixture["text"]
             )
 
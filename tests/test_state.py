@@ -0,0 +1,106 @@
+"""Tests for SQLite deduplication state."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extract.normalize import ATSSource, Posting
+from app.storage.state import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Fresh state store in a temporary directory."""
+    state_store = StateStore(tmp_path / "state.db")
+    yield state_store
+    state_store.close()
+
+
+def make_posting(i: int, title: str = None) -> Posting:
+    """Create a test posting with a distinct URL."""
+    return Posting(
+        company="Test Corp",
+        title=title or f"Software Engineering Intern {i}",
+        function_family="SWE",
+        location="Test City",
+        url=f"https://example.com/job/{i}",
+        source=ATSSource.LEVER
+    )
+
+
+class TestRollback:
+    """Tests for error handling on the shared connection."""
+
+    def test_failed_batch_is_not_committed_later(self, store):
+        """Rows written before a failure must not be committed by the next call."""
+        store._conn.execute("""
+            CREATE TRIGGER fail_insert BEFORE INSERT ON postings_seen
+            WHEN NEW.title = 'boom'
+            BEGIN SELECT RAISE(ABORT, 'boom'); END
+        """)
+        postings = [make_posting(0), make_posting(1, title="boom")]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.filter_new(postings)
+        assert not store._conn.in_transaction
+
+        store._conn.execute("DROP TRIGGER fail_insert")
+        assert len(store.filter_new(postings)) == 2
+
+
+class TestFilterNew:
+    """Tests for batch deduplication."""
+
+    def test_large_batch_is_chunked(self, store):
+        """More hashes than one IN (...) chunk should all be found."""
+        postings = [make_posting(i) for i in range(StateStore.QUERY_CHUNK_SIZE * 2 + 100)]
+        assert len(store.filter_new(postings)) == len(postings)
+        assert store.filter_new(postings) == []
+        assert store.get_stats()["total_postings"] == len(postings)
+
+    def test_duplicate_within_batch_counts_as_seen(self, store):
+        """Only the first occurrence of a posting in a batch is new."""
+        postings = [make_posting(0), make_posting(1), make_posting(0)]
+        new = store.filter_new(postings)
+        assert [p.url for p in new] == [postings[0].url, postings[1].url]
+
+    def test_conflict_keeps_first_seen_and_bumps_last_seen(self, store):
+        """Seeing a posting again should only update last_seen_at."""
+        posting = make_posting(0)
+        store.filter_new([posting])
+        store._conn.execute(
+            "UPDATE postings_seen SET first_seen_at = ?, last_seen_at = ?",
+            ("2020-01-01T00:00:00", "2020-01-02T00:00:00")
+        )
+        store._conn.commit()
+
+        store.filter_new([posting])
+        row = store._conn.execute("SELECT first_seen_at, last_seen_at FROM postings_seen").fetchone()
+        assert row["first_seen_at"] == "2020-01-01T00:00:00"
+        assert row["last_seen_at"] > "2020-01-02T00:00:00"
+
+
+class TestDateCutoffs:
+    """Tests for last_seen_at cutoffs."""
+
+    def _set_last_seen(self, store, posting, last_seen_at):
+        store._conn.execute(
+            "UPDATE postings_seen SET last_seen_at = ? WHERE hash = ?",
+            (last_seen_at.isoformat(), posting.posting_hash)
+        )
+        store._conn.commit()
+
+    def test_recent_and_old_entries(self, store):
+        """Recent postings are listed and old ones cleared, by whole days."""
+        recent, old = make_posting(0), make_posting(1)
+        store.filter_new([recent, old])
+        now = datetime.utcnow()
+        self._set_last_seen(store, recent, now - timedelta(days=3))
+        self._set_last_seen(store, old, now - timedelta(days=100))
+
+        assert [row["url"] for row in store.get_recent_postings(days=7)] == [recent.url]
+        assert len(store.get_recent_postings(days=365)) == 2
+
+        assert store.clear_old_entries(days=90) == 1
+        assert store.get_stats()["total_postings"] == 1
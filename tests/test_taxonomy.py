@@ -2,9 +2,12 @@
 
 import pytest
 
+from app.config import FunctionFamilyConfig, FunctionsConfig
 from app.extract.normalize import OTHER_FUNCTION
 from app.filtering.taxonomy import (
+    TaxonomyClassifier,
     classify_function,
+    classify_function_batch,
     is_target_function,
     get_function_display_name
 )
@@ -103,6 +106,44 @@ class TestClassifyFunction:
         assert confidence == 0.0
 
 
+class TestTaxonomyClassifier:
+    """Tests for pattern matching in a custom-configured classifier."""
+
+    def _classifier(self, a_pattern: str, b_pattern: str) -> TaxonomyClassifier:
+        return TaxonomyClassifier(FunctionsConfig(families={
+            "A": FunctionFamilyConfig(display_name="A", title_patterns=[a_pattern]),
+            "B": FunctionFamilyConfig(display_name="B", title_patterns=[b_pattern]),
+        }))
+
+    def test_patterns_starting_at_same_position(self):
+        """Both patterns should count even when they match at the same offset."""
+        classifier = self._classifier(r'\bmanagement\b', r'\bmanagement\s+consult')
+        assert classifier._matched_patterns("Management Consulting Intern") == {0, 1}
+
+    def test_description_matches_all_patterns(self):
+        """Every pattern present in a description should be found."""
+        classifier = self._classifier(r'\bpython\b', r'\bpitch\s+book\b')
+        text = "Build pitch book models in Python. " * 50
+        assert classifier._matched_patterns(text) == {0, 1}
+
+    def test_capturing_groups_fall_back(self):
+        """Patterns with groups are searched individually rather than fused."""
+        classifier = self._classifier(r'\b(data)\s+engineer', r'\bquant\b')
+        assert classifier._fused_pattern is None
+        assert classifier.classify("Data Engineer Intern") == ("A", 0.6)
+
+    def test_batch_matches_single(self):
+        """Batch classification should agree with classifying one at a time."""
+        items = [
+            ("Software Engineer Intern", "Build backend services in Python."),
+            ("Product Manager Intern", "Own the roadmap."),
+            ("Software Engineer Intern", "Build backend services in Python."),
+            ("Summer Analyst", "Join our M&A advisory team."),
+            ("Software Engineer Intern", ""),
+        ]
+        assert classify_function_batch(items) == [classify_function(t, d) for t, d in items]
+
+
 class TestIsTargetFunction:
     """Tests for target function check."""
 
@@ -151,27 +192,37 @@ class TestGetFunctionDisplayName:
         assert get_function_display_name(OTHER_FUNCTION) == "Other"
 
 
+REAL_WORLD_TITLES = [
+    ("Software Engineer Intern - Summer 2026", "SWE"),
+    ("SWE Intern, Infrastructure", "SWE"),
+    ("Full Stack Developer Intern", "SWE"),
+    ("iOS Engineer Intern", "SWE"),
+    ("Machine Learning Engineer Intern", "SWE"),
+    ("Product Manager Intern, Growth", "PM"),
+    ("Associate Product Manager (APM) Intern", "PM"),
+    ("Technical Program Manager Intern", "PM"),
+    ("Business Analyst Intern - Consulting", "Consulting"),
+    ("Strategy Consulting Summer Analyst", "Consulting"),
+    ("Management Consultant Intern", "Consulting"),
+    ("Investment Banking Summer Analyst", "IB"),
+    ("IB Analyst - M&A Group", "IB"),
+    ("Capital Markets Intern", "IB"),
+    ("Private Equity Summer Analyst", "IB"),
+]
+
+
 class TestRealWorldTitles:
     """Tests with real-world job titles."""
 
-    @pytest.mark.parametrize("title,expected", [
-        ("Software Engineer Intern - Summer 2026", "SWE"),
-        ("SWE Intern, Infrastructure", "SWE"),
-        ("Full Stack Developer Intern", "SWE"),
-        ("iOS Engineer Intern", "SWE"),
-        ("Machine Learning Engineer Intern", "SWE"),
-        ("Product Manager Intern, Growth", "PM"),
-        ("Associate Product Manager (APM) Intern", "PM"),
-        ("Technical Program Manager Intern", "PM"),
-        ("Business Analyst Intern - Consulting", "Consulting"),
-        ("Strategy Consulting Summer Analyst", "Consulting"),
-        ("Management Consultant Intern", "Consulting"),
-        ("Investment Banking Summer Analyst", "IB"),
-        ("IB Analyst - M&A Group", "IB"),
-        ("Capital Markets Intern", "IB"),
-        ("Private Equity Summer Analyst", "IB"),
-    ])
+    @pytest.mark.parametrize("title,expected", REAL_WORLD_TITLES)
     def test_real_titles(self, title, expected):
         """Test classification of real-world titles."""
         family, _ = classify_function(title)
         assert family == expected, f"'{title}' classified as {family}, expected {expected}"
+
+    def test_real_titles_batch(self):
+        """Batch classification should get every real-world title right too."""
+        families = [family for family, _ in classify_function_batch(
+            [(title, "") for title, _ in REAL_WORLD_TITLES]
+        )]
+        assert families == [expected for _, expected in REAL_WORLD_TITLES]